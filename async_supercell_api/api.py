@@ -1,58 +1,589 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from time import monotonic
 from urllib.parse import urlencode, quote
-from typing import Any, Optional, Tuple, Type
-from aiohttp import request
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional, \
+    Sequence, Tuple, Type, Union
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, request
 from . import errors
+from .cache import ResponseCache
+from .decoding import get_decoder, loads
+from .hedge import HedgePolicy
+from .interning import Interner
+from .keys import KeyPool
+from .response import Response
+from .retry import RetryPolicy
+from .scheduler import Scheduler
+from .schema import projection, variant
+from .singleflight import SingleFlight
+from .timeouts import remaining
 from .types import Page, SupercellApiResponse
 
+logger = logging.getLogger(__name__)
+
+RAW_MODES = (False, True, 'json', 'bytes')
+
 
 class SupercellAPI:
     """
     Superclass for Supercell APIs. Should not be used, use subclasses instead.
     
+    Requests are sent through a long-lived :class:`aiohttp.ClientSession`, so connections are kept alive and reused.
+    The session is created on the first request and must be released with :meth:`close`,
+    or by using the object as an async context manager: ``async with api: ...``.
+    
+    Some options can be changed for the calls made inside a block with :meth:`options`.
+    A time budget can be given to all the calls made inside a block with :func:`~async_supercell_api.timeouts.deadline`.
+    
     :param base_url:
     :param version:
-    :param api_key:
+    :param api_key: a key, or a list of keys to spread the requests over
     :param debug:
+    :param session: shared session to use instead of creating a new one. It's never closed by this object
+    :param limit: maximum number of simultaneous connections. Default: 100
+    :param limit_per_host: maximum number of simultaneous connections to the same host. Default: 0 (no limit)
+    :param keepalive_timeout: seconds an idle connection is kept open. Default: 15
+    :param ttl_dns_cache: seconds DNS lookups are cached. None caches forever. Default: 10
+    :param timeout: maximum seconds for each HTTP request, from getting a connection to reading the whole body.
+        Retries and hedges are separate requests. None keeps the timeout of the session. Default: None
+    :param connect_timeout: maximum seconds to get a connection, including the wait for a free one in the pool.
+        None keeps the timeout of the session. Default: None
+    :param read_timeout: maximum seconds between two reads of the response. None keeps the timeout of the session.
+        Default: None
+    :param rate_limit: maximum requests per second sent with each key. None disables throttling. Default: None
+    :param burst: maximum number of requests sent at once with each key. Default: max(1, rate_limit)
+    :param retry: policy used to retry requests failed with transient errors. None disables retries. Default: None
+    :param hedge: policy used to send a duplicate of the requests that are slower than usual. None disables hedging.
+        Default: None
+    :param scheduler: limits the requests sent at the same time and sends the most urgent ones first,
+        see :class:`~async_supercell_api.scheduler.Scheduler`. None sends them as soon as possible. Default: None
+    :param priority: lane of the scheduler used by the requests of this object. None for its default lane.
+        Default: None
+    :param coalesce: whether concurrent identical requests should share a single HTTP request. Default: True
+    :param cache: cache for successful responses, like :class:`~async_supercell_api.cache.MemoryCache`. Default: None
+    :param decoder: JSON decoder for the raw bodies, see :func:`~async_supercell_api.decoding.get_decoder`.
+        Default: the fastest installed between orjson, ujson and the standard library
+    :param executor: thread or process pool where large responses are decoded and converted to objects,
+        to keep the event loop responsive. None does everything inline. Default: None
+    :param offload_threshold: minimum body size in bytes for a response to be sent to the executor. Default: 256 KiB
+    :param slotted: whether to return the compact variants of the types,
+        see :class:`~async_supercell_api.types.SlottedApiResponse`. Default: False
+    :param shared: whether the objects of static types, like arenas, game modes, locations, leagues and labels,
+        should be immutable instances shared by all the responses, see
+        :func:`~async_supercell_api.schema.define_schemas`. Default: False
+    :param intern: whether identical strings of the decoded responses should share a single object,
+        or the :class:`~async_supercell_api.interning.Interner` to use, to share it between clients. Default: False
+    :param raw: whether the methods should skip the objects and return the decoded JSON (True or ``'json'``)
+        or the body of the response (``'bytes'``). Errors are still raised as
+        :class:`~async_supercell_api.errors.ClientError`. Default: False
     :type base_url: str
     :type version: str
-    :type api_key: str
+    :type api_key: Union[str, Sequence[str]]
     :type debug: bool
+    :type session: Optional[:class:`aiohttp.ClientSession`]
+    :type limit: int
+    :type limit_per_host: int
+    :type keepalive_timeout: float
+    :type ttl_dns_cache: Optional[int]
+    :type timeout: Optional[float]
+    :type connect_timeout: Optional[float]
+    :type read_timeout: Optional[float]
+    :type rate_limit: Optional[float]
+    :type burst: Optional[int]
+    :type retry: Optional[:class:`~async_supercell_api.retry.RetryPolicy`]
+    :type hedge: Optional[:class:`~async_supercell_api.hedge.HedgePolicy`]
+    :type scheduler: Optional[:class:`~async_supercell_api.scheduler.Scheduler`]
+    :type priority: Optional[str]
+    :type coalesce: bool
+    :type cache: Optional[:class:`~async_supercell_api.cache.ResponseCache`]
+    :type decoder: Union[str, Callable[[bytes], Any], None]
+    :type executor: Optional[:class:`concurrent.futures.Executor`]
+    :type offload_threshold: int
+    :type slotted: bool
+    :type shared: bool
+    :type intern: Union[bool, :class:`~async_supercell_api.interning.Interner`]
+    :type raw: Union[bool, str]
     """
     
-    def __init__(self, base_url: str, version: str, api_key: str, debug: bool = False):
+    def __init__(self, base_url: str, version: str, api_key: Union[str, Sequence[str]], debug: bool = False,
+                 session: Optional[ClientSession] = None, limit: int = 100, limit_per_host: int = 0,
+                 keepalive_timeout: float = 15, ttl_dns_cache: Optional[int] = 10, timeout: Optional[float] = None,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None,
+                 rate_limit: Optional[float] = None, burst: Optional[int] = None, retry: Optional[RetryPolicy] = None,
+                 hedge: Optional[HedgePolicy] = None,
+                 scheduler: Optional[Scheduler] = None, priority: Optional[str] = None, coalesce: bool = True,
+                 cache: Optional[ResponseCache] = None, decoder: Union[str, Callable[[bytes], Any], None] = None,
+                 executor: Optional[Executor] = None, offload_threshold: int = 256 * 1024, slotted: bool = False,
+                 shared: bool = False, intern: Union[bool, Interner] = False, raw: Union[bool, str] = False):
         self.base_url = base_url.strip('/')
         self.version = version.strip('/')
-        self.api_key = api_key
+        self.keys = KeyPool([api_key] if isinstance(api_key, str) else api_key, rate_limit, burst)
+        self.api_key = self.keys.keys[0].key
         self.debug = debug
+        self.timeout = _check_timeout(timeout)
+        self.connect_timeout = _check_timeout(connect_timeout)
+        self.read_timeout = _check_timeout(read_timeout)
+        self.retry = retry
+        self.hedge = hedge
+        self.scheduler = scheduler
+        self.priority = priority
+        self.in_flight = SingleFlight() if coalesce else None
+        self.cache = cache
+        self.interner = Interner() if intern is True else intern or None
+        self.decoder = get_decoder(decoder)
+        if self.interner is not None:
+            self.decoder = self.interner.wrap(self.decoder)
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        self.slotted = slotted
+        self.shared = shared
+        self.raw = _check_raw(raw)
+        self._options: ContextVar[Dict[str, Any]] = ContextVar(f'options_{id(self)}', default = {})
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self._session = session
+        self._owns_session = session is None
+        self._connector_options = {
+            'limit': limit,
+            'limit_per_host': limit_per_host,
+            'keepalive_timeout': keepalive_timeout,
+            'ttl_dns_cache': ttl_dns_cache,
+        }
+    
+    @property
+    def session(self) -> ClientSession:
+        """
+        Session used for all the requests. If none was given, it's created on first use.
+        
+        :rtype: :class:`aiohttp.ClientSession`
+        """
+        
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = ClientSession(connector = TCPConnector(**self._connector_options))
+        return self._session
+    
+    async def close(self) -> None:
+        """
+        Closes the session and all its pooled connections, unless the session was given by the caller.
+        Pending background refreshes of the cache are cancelled.
+        """
+        
+        for task in list(self._refreshes.values()):
+            task.cancel()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    @contextmanager
+    def options(self, raw: Union[bool, str, None] = None, fields: Optional[Iterable[str]] = None,
+                priority: Optional[str] = None, timeout: Optional[float] = None,
+                connect_timeout: Optional[float] = None,
+                read_timeout: Optional[float] = None) -> Iterator['SupercellAPI']:
+        """
+        Overrides some options of this object for the calls made inside the block, including the ones made by tasks
+        created inside it. Options left to None keep their current value.
+        
+        Example::
+            
+            with api.options(raw = True):
+                player = await api.get_player('#2PP')  # a dict
+            
+            with api.options(fields = ['trophies', 'clan.tag']):
+                player = await api.get_player('#2PP')  # only player.trophies and player.clan.tag are set
+            
+            with api.options(priority = 'interactive'):
+                player = await api.get_player('#2PP')  # sent before the waiting requests of the other lanes
+            
+            with api.options(timeout = 2):
+                player = await api.get_player('#2PP')  # raises asyncio.TimeoutError after 2 seconds without response
+        
+        :param raw: see the parameters of the class
+        :param fields: names of the only fields to build, with dotted paths for the fields of nested objects.
+            For pages, they select the fields of the items. Ignored in raw mode,
+            see :class:`~async_supercell_api.schema.Projection`
+        :param priority: see the parameters of the class
+        :param timeout: see the parameters of the class
+        :param connect_timeout: see the parameters of the class
+        :param read_timeout: see the parameters of the class
+        :type raw: Union[bool, str, None]
+        :type fields: Optional[Iterable[str]]
+        :type priority: Optional[str]
+        :type timeout: Optional[float]
+        :type connect_timeout: Optional[float]
+        :type read_timeout: Optional[float]
+        :rtype: Iterator[:class:`SupercellAPI`]
+        """
+        
+        options = dict(self._options.get())
+        if raw is not None:
+            options['raw'] = _check_raw(raw)
+        if fields is not None:
+            options['fields'] = _check_fields(fields)
+        if priority is not None:
+            options['priority'] = self.scheduler.lane(priority).name if self.scheduler is not None else priority
+        for name, value in (('timeout', timeout), ('connect_timeout', connect_timeout), ('read_timeout', read_timeout)):
+            if value is not None:
+                options[name] = _check_timeout(value)
+        token = self._options.set(options)
+        try:
+            yield self
+        finally:
+            self._options.reset(token)
+    
+    def _option(self, name: str) -> Any:
+        return self._options.get().get(name, getattr(self, name))
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
     
     @staticmethod
     async def make_request(url: str, method: str = 'GET', headers: dict = None, json: dict = None,
-                           debug: bool = False) -> Tuple[int, Any]:
-        async with request(method, url, headers = headers, json = json) as response:
+                           debug: bool = False, session: Optional[ClientSession] = None,
+                           decoder: Callable[[bytes], Any] = loads,
+                           timeout: Optional[ClientTimeout] = None) -> Response:
+        # the timeout is only passed if set, None would disable the timeouts of the session
+        options = {} if timeout is None else {'timeout': timeout}
+        if session is None:
+            context = request(method, url, headers = headers, json = json, **options)
+        else:
+            context = session.request(method, url, headers = headers, json = json, **options)
+        async with context as response:
             if debug:
                 print(response.status, url)
-            return response.status, await response.json()
+            return Response(response.status, headers = response.headers, body = await response.read(),
+                            decoder = decoder)
     
-    async def make_api_request(self, url: str, **kwargs: Any) -> Tuple[int, Any]:
-        kwargs = {n: v for n, v in kwargs.items() if v is not None}
+    async def make_api_request(self, url: str, **kwargs: Any) -> Response:
+        kwargs = sorted((n, v) for n, v in kwargs.items() if v is not None)
         encoded_kwargs = f'?{urlencode(kwargs)}' if kwargs else ''
-        return await SupercellAPI.make_request(
-            f'{self.base_url}/{self.version}/{quote(url.lstrip("/"))}{encoded_kwargs}',
-            headers = {'Authorization': f'Bearer {self.api_key}'},
-            debug = self.debug
+        full_url = f'{self.base_url}/{self.version}/{quote(url.lstrip("/"))}{encoded_kwargs}'
+        left = remaining()
+        if left is None:
+            return await self._get(url, full_url)
+        if left <= 0:
+            raise asyncio.TimeoutError(f'deadline exceeded before requesting {full_url}')
+        # on timeout the request is cancelled, which frees its connection, key and scheduler slot
+        return await asyncio.wait_for(self._get(url, full_url), left)
+    
+    async def _get(self, url: str, full_url: str) -> Response:
+        if self.cache is not None:
+            entry = await self.cache.get(full_url)
+            if entry is not None:
+                if not entry.fresh and full_url not in self._refreshes:
+                    task = asyncio.ensure_future(self._refresh(url, full_url))
+                    self._refreshes[full_url] = task
+                    task.add_done_callback(lambda _: self._refreshes.pop(full_url, None))
+                return entry.response
+        return await self._coalesced_fetch(url, full_url)
+    
+    async def _coalesced_fetch(self, path: str, url: str) -> Response:
+        if self.in_flight is None:
+            return await self._fetch(path, url)
+        return await self.in_flight.do(('GET', url), lambda: self._fetch(path, url))
+    
+    async def _refresh(self, path: str, url: str) -> None:
+        try:
+            response = await self._coalesced_fetch(path, url)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning('Background refresh of %s failed', url, exc_info = True)
+        else:
+            if not 200 <= response.status < 300:
+                logger.warning('Background refresh of %s failed with status %s', url, response.status)
+    
+    async def _fetch(self, path: str, url: str) -> Response:
+        if self.hedge is None:
+            send = partial(self._send, url)
+        else:
+            send = partial(self.hedge.run, partial(self._send, url))
+        if self.retry is None:
+            response = await send()
+        else:
+            response = await self.retry.run(send)
+        if self.cache is not None:
+            ttl = self.cache.ttl(path, response)
+            if ttl > 0:
+                await self.cache.set(url, response, ttl)
+        return response
+    
+    async def _send(self, url: str) -> Response:
+        if self.scheduler is not None:
+            await self.scheduler.acquire(self._option('priority'))
+        status = latency = None
+        try:
+            key = await self.keys.acquire()
+            response = None
+            start = monotonic()
+            try:
+                response = await SupercellAPI.make_request(
+                    url,
+                    headers = {'Authorization': f'Bearer {key.key}'},
+                    debug = self.debug,
+                    session = self.session,
+                    decoder = self.decoder,
+                    timeout = self._timeout()
+                )
+            except Exception:
+                # failed request, reported without status
+                latency = monotonic() - start
+                raise
+            finally:
+                self.keys.release(key, response)
+            status, latency = response.status, monotonic() - start
+        finally:
+            if self.scheduler is not None:
+                self.scheduler.release(status, latency)
+        return response
+    
+    def _timeout(self) -> Optional[ClientTimeout]:
+        total, connect, read = self._option('timeout'), self._option('connect_timeout'), self._option('read_timeout')
+        if total is None and connect is None and read is None:
+            return None
+        default = self.session.timeout
+        return ClientTimeout(
+            total = default.total if total is None else total,
+            connect = default.connect if connect is None else connect,
+            sock_read = default.sock_read if read is None else read,
+            sock_connect = default.sock_connect
         )
     
-    @staticmethod
-    async def create_object(response: Tuple[int, Any], object_class: Type[SupercellApiResponse] = Page,
-                            page_generic_type: Optional[Type[SupercellApiResponse]] = None) -> Any:
-        status, json_response = response
-        if 200 <= status < 300:
-            t = type(json_response)
-            if object_class is not None:
-                if t == dict:
-                    return object_class(**json_response, _page_generic_type = page_generic_type)
-                if t == list:
-                    return list(map(lambda x: object_class(**x), json_response))
-            return json_response
+    async def create_object(self, response: Tuple[int, Any], object_class: Type[SupercellApiResponse] = Page,
+                            page_generic_type: Optional[Type[SupercellApiResponse]] = None,
+                            fields: Optional[Iterable[str]] = None) -> Any:
+        raw = self._option('raw')
+        fields = self._options.get().get('fields') if fields is None else _check_fields(fields)
+        offload = (
+                self.executor is not None and isinstance(response, Response) and response.ok
+                and not response.decoded and len(response.body) >= self.offload_threshold
+        )
+        if raw:
+            if raw == 'bytes' or not offload:
+                return raw_object(response, raw)
+            return await asyncio.get_event_loop().run_in_executor(self.executor, response.decoder, response.body)
+        if offload:
+            return await asyncio.get_event_loop().run_in_executor(
+                self.executor,
+                partial(_decode_object, response.status, response.body, response.decoder, object_class,
+                        page_generic_type, self.slotted, fields, self.shared)
+            )
+        return build_object(response, object_class, page_generic_type, self.slotted, fields, self.shared)
+    
+    async def iterate(self, method: Callable[..., Awaitable[Page]], *args: Any, page_size: Optional[int] = None,
+                      max_items: Optional[int] = None, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Iterates over the items of all the pages returned by a paged method, following the ``after`` cursors.
+        While the items of a page are being consumed, the next page is already being fetched.
+        In raw mode the items are dicts; the ``'bytes'`` mode is not supported.
+        
+        Example::
+            
+            async for player in api.iterate(api.get_player_ranking, 'global', page_size = 200, max_items = 1000):
+                print(player.name)
+        
+        :param method: a method of this object returning a :class:`Page`
+        :param args: positional arguments of the method
+        :param page_size: number of items requested with each page. None uses the default of the API
+        :param max_items: maximum number of items to return. None for no limit
+        :param kwargs: keyword arguments of the method
+        :type method: Callable[..., Awaitable[:class:`Page`]]
+        :type args: Any
+        :type page_size: Optional[int]
+        :type max_items: Optional[int]
+        :type kwargs: Any
+        :rtype: AsyncIterator[Any]
+        """
+        
+        def fetch(after: Optional[str], fetched: int) -> asyncio.Future:
+            remaining = None if max_items is None else max_items - fetched
+            limit = min((n for n in (page_size, remaining) if n is not None), default = None)
+            return asyncio.ensure_future(method(*args, **kwargs, limit = limit, after = after))
+        
+        if max_items is not None and max_items <= 0:
+            return
+        count = 0
+        next_page = fetch(kwargs.pop('after', None), 0)
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if isinstance(page, dict):
+                    items, paging = page.get('items') or [], page.get('paging')
+                else:
+                    items, paging = page.items or [], page.paging
+                after = ((paging or {}).get('cursors') or {}).get('after')
+                if after and items and (max_items is None or count + len(items) < max_items):
+                    next_page = fetch(after, count + len(items))
+                for item in items:
+                    yield item
+                    count += 1
+                    if count == max_items:
+                        return
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+    
+    async def bulk(self, method: Callable[..., Awaitable[Any]], args: Union[Iterable[Any], AsyncIterable[Any]],
+                   concurrency: int = 10, **kwargs: Any) -> AsyncIterator[Tuple[Any, Any]]:
+        """
+        Calls a method once for each argument, with at most ``concurrency`` calls running at the same time,
+        and yields the results as soon as they are ready, in completion order.
+        Arguments are read only when a call can start, so memory doesn't depend on how many there are.
+        A call that fails doesn't stop the others: its exception is yielded as the result.
+        Stopping the iteration cancels the calls still running.
+        
+        Example::
+            
+            async for tag, player in api.bulk(api.get_player, tags, concurrency = 20):
+                if isinstance(player, Exception):
+                    print(tag, 'failed:', player)
+        
+        :param method: a method of this object
+        :param args: first argument of each call, like tags. Can be an async iterable
+        :param concurrency: maximum number of calls running at the same time. Default: 10
+        :param kwargs: keyword arguments of all the calls
+        :type method: Callable[..., Awaitable[Any]]
+        :type args: Union[Iterable[Any], AsyncIterable[Any]]
+        :type concurrency: int
+        :type kwargs: Any
+        :rtype: AsyncIterator[Tuple[Any, Any]]
+        """
+        
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        if isinstance(args, AsyncIterable):
+            iterator = args.__aiter__()
+            next_arg = iterator.__anext__
         else:
-            raise errors.ClientError(**(json_response or {}))
+            iterator = iter(args)
+            
+            async def next_arg():
+                try:
+                    return next(iterator)
+                except StopIteration:
+                    raise StopAsyncIteration from None
+        
+        running: Dict[asyncio.Future, Any] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(running) < concurrency:
+                    try:
+                        arg = await next_arg()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        running[asyncio.ensure_future(method(arg, **kwargs))] = arg
+                if not running:
+                    return
+                done, _ = await asyncio.wait(running, return_when = asyncio.FIRST_COMPLETED)
+                for task in done:
+                    arg = running.pop(task)
+                    if task.cancelled():
+                        yield arg, asyncio.CancelledError()
+                    else:
+                        yield arg, task.exception() or task.result()
+        finally:
+            for task in running:
+                task.cancel()
+
+
+def build_object(response: Tuple[int, Any], object_class: Type[SupercellApiResponse] = Page,
+                 page_generic_type: Optional[Type[SupercellApiResponse]] = None, slotted: bool = False,
+                 fields: Optional[Tuple[str, ...]] = None, shared: bool = False, lazy: bool = True) -> Any:
+    """
+    Converts a response to objects of the given type, or raises a :class:`~async_supercell_api.errors.ClientError`
+    if the status is not 2xx.
+    
+    :param response: status and decoded JSON of the response
+    :param object_class: type of the object, or of the items if the response is a list
+    :param page_generic_type: type of the items if the object is a :class:`~async_supercell_api.types.Page`
+    :param slotted: whether to build the compact variants of the types
+    :param fields: only fields to build, see :class:`~async_supercell_api.schema.Projection`. None builds all of them
+    :param shared: whether to build the shared variants of the types
+    :param lazy: whether the items of pages should be built on first access, see
+        :class:`~async_supercell_api.types.LazyList`. Otherwise they are all built right away, in a plain list
+    :type response: Tuple[int, Any]
+    :type object_class: Type[:class:`~async_supercell_api.types.SupercellApiResponse`]
+    :type page_generic_type: Optional[Type[:class:`~async_supercell_api.types.SupercellApiResponse`]]
+    :type slotted: bool
+    :type fields: Optional[Tuple[str, ...]]
+    :type shared: bool
+    :type lazy: bool
+    :rtype: Any
+    """
+    
+    status, json_response = response
+    if 200 <= status < 300:
+        t = type(json_response)
+        object_class = variant(object_class, slotted, shared)
+        page_generic_type = variant(page_generic_type, slotted, shared)
+        if fields is not None:
+            if page_generic_type is None:
+                object_class = object_class and projection(object_class, fields)
+            else:
+                page_generic_type = projection(page_generic_type, fields)
+        if object_class is not None:
+            if t == dict:
+                if page_generic_type is None:
+                    return object_class.from_dict(json_response)
+                items = json_response.get('items')
+                if not lazy and type(items) is list:
+                    return object_class(**{**json_response, 'items': list(map(page_generic_type.from_dict, items))})
+                return object_class(**json_response, _page_generic_type = page_generic_type)
+            if t == list:
+                return list(map(object_class.from_dict, json_response))
+        return json_response
+    else:
+        raise errors.ClientError(**{**(json_response or {}), 'status': status})
+
+
+def raw_object(response: Union[Response, Tuple[int, Any]], raw: Union[bool, str] = True) -> Any:
+    """
+    Returns the decoded JSON of a response, or its body if ``raw`` is ``'bytes'``, without building any object.
+    Like :func:`build_object`, raises a :class:`~async_supercell_api.errors.ClientError` if the status is not 2xx.
+    The returned value may be shared with the cache and other callers, so it should not be modified.
+    
+    :param response:
+    :param raw: True or ``'json'`` for the decoded JSON, ``'bytes'`` for the body
+    :type response: Union[:class:`~async_supercell_api.response.Response`, Tuple[int, Any]]
+    :type raw: Union[bool, str]
+    :rtype: Any
+    """
+    
+    if not isinstance(response, Response):
+        response = Response(*response)
+    if not response.ok:
+        build_object(response)
+    return response.body if raw == 'bytes' else response.data
+
+
+def _check_raw(raw: Union[bool, str]) -> Union[bool, str]:
+    if raw not in RAW_MODES:
+        raise ValueError(f'raw must be one of {RAW_MODES}, not {raw!r}')
+    return raw
+
+
+def _check_timeout(timeout: Optional[float]) -> Optional[float]:
+    if timeout is not None and timeout <= 0:
+        raise ValueError(f'timeouts must be positive, not {timeout!r}')
+    return timeout
+
+
+def _check_fields(fields: Iterable[str]) -> Tuple[str, ...]:
+    return (fields,) if isinstance(fields, str) else tuple(sorted(set(fields)))
+
+
+def _decode_object(status: int, body: bytes, decoder: Callable[[bytes], Any],
+                   object_class: Type[SupercellApiResponse], page_generic_type: Optional[Type[SupercellApiResponse]],
+                   slotted: bool, fields: Optional[Tuple[str, ...]], shared: bool) -> Any:
+    # runs in the executor of the client, possibly in another process: items are built there,
+    # not later on the event loop, and only the objects are sent back
+    return build_object((status, decoder(body) if body else None), object_class, page_generic_type, slotted, fields,
+                        shared, False)
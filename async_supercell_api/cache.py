@@ -0,0 +1,360 @@
+import asyncio
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from time import time
+from typing import Any, Callable, Dict, Optional
+from .decoding import loads
+from .response import Response
+
+
+class CacheEntry:
+    """
+    Cached response together with its expiration time.
+    
+    :param response:
+    :param expires: expiration as a unix timestamp
+    :type response: :class:`~async_supercell_api.response.Response`
+    :type expires: float
+    """
+    
+    __slots__ = ('response', 'expires')
+    
+    def __init__(self, response: Response, expires: float):
+        self.response = response
+        self.expires = expires
+    
+    @property
+    def fresh(self) -> bool:
+        return time() < self.expires
+    
+    def usable(self, grace: float) -> bool:
+        """
+        Returns whether the entry is fresh or expired since less than ``grace`` seconds.
+        
+        :param grace:
+        :type grace: float
+        :rtype: bool
+        """
+        
+        return time() < self.expires + grace
+
+
+class ResponseCache(ABC):
+    """
+    Base class for response caches. Subclasses store the entries by implementing :meth:`get`, :meth:`set` and
+    :meth:`clear`, and update the :attr:`hits`, :attr:`misses` and :attr:`evictions` counters.
+    
+    Successful responses are cached for the ``max-age`` of their ``Cache-Control`` header,
+    unless the path of the endpoint matches one of the ``ttl`` overrides.
+    
+    With ``stale_while_revalidate``, expired entries are kept for that many more seconds:
+    during this grace window they are still returned, while a single background request refreshes them.
+    Stale entries returned this way are counted in :attr:`stale_hits`.
+    
+    :param ttl: seconds to cache the responses of the matching endpoints, by path pattern.
+        Patterns are matched with :func:`fnmatch.fnmatchcase` against the path passed to
+        :meth:`~async_supercell_api.api.SupercellAPI.make_api_request`, like ``'/cards'`` or ``'/locations/*'``
+    :param stale_while_revalidate: grace window in seconds after expiration. Default: 0
+    :type ttl: Optional[Dict[str, float]]
+    :type stale_while_revalidate: float
+    """
+    
+    def __init__(self, ttl: Optional[Dict[str, float]] = None, stale_while_revalidate: float = 0):
+        self.ttl_overrides = dict(ttl or {})
+        self.stale_while_revalidate = stale_while_revalidate
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def ttl(self, path: str, response: Response) -> float:
+        """
+        Returns the number of seconds the response should be cached for. 0 means it should not be cached.
+        
+        :param path: path of the endpoint
+        :param response:
+        :type path: str
+        :type response: :class:`~async_supercell_api.response.Response`
+        :rtype: float
+        """
+        
+        if not 200 <= response.status < 300:
+            return 0
+        for pattern, ttl in self.ttl_overrides.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return response.max_age or 0
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Returns the entry stored with the given key, or None if missing or expired for longer than the grace window.
+        
+        :param key: normalized url of the request
+        :type key: str
+        :rtype: Optional[:class:`CacheEntry`]
+        """
+    
+    @abstractmethod
+    async def set(self, key: str, response: Response, ttl: float) -> None:
+        """
+        Stores a response for the given number of seconds.
+        
+        :param key: normalized url of the request
+        :param response:
+        :param ttl:
+        :type key: str
+        :type response: :class:`~async_supercell_api.response.Response`
+        :type ttl: float
+        """
+    
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Removes all the entries.
+        """
+    
+    async def close(self) -> None:
+        """
+        Releases the resources held by the cache. Caches are never closed by the clients using them.
+        """
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-memory LRU cache, bounded by number of entries and/or total size of the response bodies.
+    Responses are stored without their decoded JSON, which is often several times larger than the body,
+    so the size counted is the memory actually held. Each hit returns a copy that is decoded on demand.
+    
+    :param max_entries: maximum number of entries. None for no limit. Default: 1024
+    :param max_bytes: maximum total size of the cached bodies. None for no limit. Default: None
+    :param ttl: per-endpoint overrides, see :class:`ResponseCache`
+    :param stale_while_revalidate: grace window, see :class:`ResponseCache`
+    :type max_entries: Optional[int]
+    :type max_bytes: Optional[int]
+    :type ttl: Optional[Dict[str, float]]
+    :type stale_while_revalidate: float
+    """
+    
+    def __init__(self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None,
+                 ttl: Optional[Dict[str, float]] = None, stale_while_revalidate: float = 0):
+        super().__init__(ttl, stale_while_revalidate)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None and not entry.usable(self.stale_while_revalidate):
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if entry.fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        # callers decode the response they get, the stored one must stay undecoded
+        return CacheEntry(entry.response.undecoded(), entry.expires)
+    
+    async def set(self, key: str, response: Response, ttl: float) -> None:
+        if key in self._entries:
+            self._remove(key)
+        size = len(response.body)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self._entries[key] = CacheEntry(response.undecoded(), time() + ttl)
+        self.size += size
+        while (self.max_entries is not None and len(self._entries) > self.max_entries) or (
+                self.max_bytes is not None and self.size > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+    
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+    
+    def _remove(self, key: str) -> None:
+        self.size -= len(self._entries.pop(key).response.body)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Persistent cache stored in a SQLite database, that can be shared by several processes.
+    Raw bodies are stored together with status and expiration, and decoded again when used.
+    
+    The database runs in WAL mode, so readers and writers of different processes don't block each other.
+    All the queries run on a dedicated thread, to keep the event loop free.
+    When the stored bodies exceed ``max_bytes``, the least recently used entries are evicted.
+    Their total size is kept up to date by triggers, so checking it doesn't scan the table.
+    Reads only write to the database to record the last access of an entry, and at most once per
+    ``access_interval`` seconds, so the processes reading the cache rarely wait for the write lock.
+    Space freed by evictions is given back to the file system by :meth:`vacuum`.
+    
+    :param path: path of the database file
+    :param max_bytes: maximum total size of the stored bodies. None for no limit. Default: None
+    :param ttl: per-endpoint overrides, see :class:`ResponseCache`
+    :param stale_while_revalidate: grace window, see :class:`ResponseCache`
+    :param loads: function used to decode the stored bodies. Default: the fastest installed JSON decoder
+    :param timeout: seconds to wait for a lock held by another process. Default: 30
+    :param access_interval: precision in seconds of the last access times used to evict entries. Default: 60
+    :type path: str
+    :type max_bytes: Optional[int]
+    :type ttl: Optional[Dict[str, float]]
+    :type stale_while_revalidate: float
+    :type loads: Callable[[bytes], Any]
+    :type timeout: float
+    :type access_interval: float
+    """
+    
+    def __init__(self, path: str, max_bytes: Optional[int] = None, ttl: Optional[Dict[str, float]] = None,
+                 stale_while_revalidate: float = 0, loads: Callable[[bytes], Any] = loads, timeout: float = 30,
+                 access_interval: float = 60):
+        super().__init__(ttl, stale_while_revalidate)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.loads = loads
+        self.timeout = timeout
+        self.access_interval = access_interval
+        self._executor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = 'SQLiteCache')
+        self._connection: Optional[sqlite3.Connection] = None
+    
+    async def _run(self, func: Callable, *args: Any) -> Any:
+        return await asyncio.get_event_loop().run_in_executor(self._executor, func, *args)
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout = self.timeout, isolation_level = None)
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+            # rows replaced by INSERT OR REPLACE only fire the delete trigger with recursive triggers
+            connection.execute('PRAGMA recursive_triggers = ON')
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS responses ('
+                    'key TEXT PRIMARY KEY, status INTEGER NOT NULL, body BLOB NOT NULL, '
+                    'expires REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL)'
+                )
+                connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+                # running total of the sizes, initialized from the entries of databases created without it
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS stats (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)'
+                )
+                connection.execute(
+                    'INSERT OR IGNORE INTO stats (id, size) SELECT 0, COALESCE(SUM(size), 0) FROM responses'
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses '
+                    'BEGIN UPDATE stats SET size = size + NEW.size WHERE id = 0; END'
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses '
+                    'BEGIN UPDATE stats SET size = size - OLD.size WHERE id = 0; END'
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses '
+                    'BEGIN UPDATE stats SET size = size + NEW.size - OLD.size WHERE id = 0; END'
+                )
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+    
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = await self._run(self._get, key)
+        if entry is None:
+            self.misses += 1
+        elif entry.fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry
+    
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        connection = self._connect()
+        row = connection.execute(
+            'SELECT status, body, expires, accessed FROM responses WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        status, body, expires, accessed = row
+        now = time()
+        if now >= expires + self.stale_while_revalidate:
+            connection.execute('DELETE FROM responses WHERE key = ? AND expires = ?', (key, expires))
+            return None
+        if now - accessed >= self.access_interval:
+            connection.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+        return CacheEntry(Response(status, body = bytes(body), decoder = self.loads), expires)
+    
+    async def set(self, key: str, response: Response, ttl: float) -> None:
+        self.evictions += await self._run(self._set, key, response.status, response.body, ttl)
+    
+    def _set(self, key: str, status: int, body: bytes, ttl: float) -> int:
+        if self.max_bytes is not None and len(body) > self.max_bytes:
+            return 0
+        connection = self._connect()
+        now = time()
+        connection.execute(
+            'INSERT OR REPLACE INTO responses (key, status, body, expires, accessed, size) VALUES (?, ?, ?, ?, ?, ?)',
+            (key, status, body, now + ttl, now, len(body))
+        )
+        if self.max_bytes is None:
+            return 0
+        return self._evict(connection)
+    
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            excess = connection.execute('SELECT size FROM stats WHERE id = 0').fetchone()[0] - self.max_bytes
+            keys = []
+            if excess > 0:
+                for key, size in connection.execute('SELECT key, size FROM responses ORDER BY accessed'):
+                    keys.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                connection.executemany('DELETE FROM responses WHERE key = ?', keys)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        return len(keys)
+    
+    async def clear(self) -> None:
+        await self._run(lambda: self._connect().execute('DELETE FROM responses'))
+    
+    async def vacuum(self) -> None:
+        """
+        Removes the expired entries and compacts the database file.
+        """
+        
+        await self._run(self._vacuum)
+    
+    def _vacuum(self) -> None:
+        connection = self._connect()
+        connection.execute('DELETE FROM responses WHERE expires + ? <= ?', (self.stale_while_revalidate, time()))
+        connection.execute('VACUUM')
+        connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    
+    async def close(self) -> None:
+        await self._run(self._close)
+        self._executor.shutdown(wait = False)
+    
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -1,9 +1,11 @@
-from typing import Optional
+from ...schema import define_schemas
 from ...types import SupercellApiResponse
 
 
 class GoldPassSeason(SupercellApiResponse):
-    def __init__(self, startTime: Optional[str] = None, endTime: Optional[str] = None, **kwargs):
-        super().__init__(**kwargs)
-        self.startTime = startTime
-        self.endTime = endTime
+    pass
+
+
+define_schemas({
+    GoldPassSeason: {'startTime': None, 'endTime': None},
+})
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, Union
 from . import types
 from ..api import SupercellAPI
 from ..types import Page
@@ -10,12 +10,13 @@ class ClashRoyaleAPI(SupercellAPI):
     
     :param api_key: 
     :param debug: in case you want the class to print every url and response status. Default (and suggested) False
+    :param kwargs: other options, see :class:`~async_supercell_api.api.SupercellAPI`
     :type api_key: str
     :type debug: Optional[bool]
     """
     
-    def __init__(self, api_key: str, debug: bool = False):
-        super(ClashRoyaleAPI, self).__init__('https://api.clashroyale.com', 'v1', api_key, debug)
+    def __init__(self, api_key: str, debug: bool = False, **kwargs):
+        super(ClashRoyaleAPI, self).__init__('https://api.clashroyale.com', 'v1', api_key, debug, **kwargs)
     
     # clans
     async def get_clan_war_log(self, clanTag: str, limit: Optional[int] = None, after: Optional[str] = None,
@@ -159,6 +160,27 @@ class ClashRoyaleAPI(SupercellAPI):
             types.clans.Clan
         )
     
+    def get_clans(self, clanTags: Iterable[str], concurrency: int = 10) -> \
+            AsyncIterator[Tuple[str, Union[types.clans.Clan, Exception]]]:
+        """
+        Get information about many clans at once, with at most ``concurrency`` requests running at the same time.
+        Results are yielded as soon as they are ready, together with their tag, and errors are yielded as results.
+        See :meth:`~async_supercell_api.api.SupercellAPI.bulk`.
+        
+        Example::
+        
+            async for tag, result in api.get_clans(tags):
+                ...
+        
+        :param clanTags:
+        :param concurrency: Default: 10
+        :type clanTags: Iterable[str]
+        :type concurrency: int
+        :rtype: AsyncIterator[Tuple[str, Union[:class:`~types.clans.Clan`, Exception]]]
+        """
+        
+        return self.bulk(self.get_clan, clanTags, concurrency)
+    
     async def get_clan_members(self, clanTag: str, limit: Optional[int] = None, after: Optional[str] = None,
                                before: Optional[str] = None) -> Page[types.clans.ClanMember]:
         """
@@ -225,6 +247,27 @@ class ClashRoyaleAPI(SupercellAPI):
             types.players.Player
         )
     
+    def get_players(self, playerTags: Iterable[str], concurrency: int = 10) -> \
+            AsyncIterator[Tuple[str, Union[types.players.Player, Exception]]]:
+        """
+        Get information about many players at once, with at most ``concurrency`` requests running at the same time.
+        Results are yielded as soon as they are ready, together with their tag, and errors are yielded as results.
+        See :meth:`~async_supercell_api.api.SupercellAPI.bulk`.
+        
+        Example::
+        
+            async for tag, result in api.get_players(tags):
+                ...
+        
+        :param playerTags:
+        :param concurrency: Default: 10
+        :type playerTags: Iterable[str]
+        :type concurrency: int
+        :rtype: AsyncIterator[Tuple[str, Union[:class:`~types.players.Player`, Exception]]]
+        """
+        
+        return self.bulk(self.get_player, playerTags, concurrency)
+    
     async def get_player_upcoming_chests(self, playerTag: str) -> types.players.UpcomingChests:
         """
         Get list of reward chests that the player will receive next in the game.
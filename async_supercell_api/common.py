@@ -0,0 +1,13 @@
+from .schema import define_schemas
+from .types import SupercellApiResponse
+
+
+class Location(SupercellApiResponse):
+    """
+    Location of clans, players and rankings, with the same ids in all the games.
+    """
+
+
+define_schemas({
+    Location: {'localizedName': None, 'id': None, 'name': None, 'isCountry': None, 'countryCode': None},
+}, static = (Location,))
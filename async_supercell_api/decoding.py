@@ -0,0 +1,42 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+Decoder = Callable[[bytes], Any]
+
+DECODERS: Dict[str, Decoder] = {'json': json.loads}
+if ujson is not None:
+    DECODERS['ujson'] = ujson.loads
+if orjson is not None:
+    DECODERS['orjson'] = orjson.loads
+
+
+def get_decoder(decoder: Union[str, Decoder, None] = None) -> Decoder:
+    """
+    Returns a function decoding JSON from raw bytes.
+    
+    :param decoder: name of an installed backend (``'orjson'``, ``'ujson'`` or ``'json'``), a custom function,
+        or None to use the fastest installed backend, falling back to the standard library
+    :type decoder: Union[str, Callable[[bytes], Any], None]
+    :rtype: Callable[[bytes], Any]
+    """
+    
+    if callable(decoder):
+        return decoder
+    if decoder is None:
+        return DECODERS.get('orjson') or DECODERS.get('ujson') or DECODERS['json']
+    try:
+        return DECODERS[decoder]
+    except KeyError:
+        raise ValueError(f'JSON decoder {decoder!r} is not installed') from None
+
+
+loads: Decoder = get_decoder()
@@ -9,18 +9,22 @@ class ClientError(Exception):
     :param message:
     :param type:
     :param detail:
+    :param status: HTTP status of the response
     :type reason: Optional[str]
     :type message: Optional[str]
     :type type: Optional[str]
     :type detail: Optional[Dict[str, Any]]
+    :type status: Optional[int]
     """
     
     def __init__(self, reason: Optional[str] = None, message: Optional[str] = 'Unknown error',
-                 type: Optional[str] = None, detail: Optional[Dict[str, Any]] = None, **kwargs):
+                 type: Optional[str] = None, detail: Optional[Dict[str, Any]] = None, status: Optional[int] = None,
+                 **kwargs):
         super().__init__(f'Message: {message}. Reason: {reason}')
         self.reason = reason
         self.message = message
         self.type = type
         self.detail = detail
+        self.status = status
         for key, value in kwargs.items():
             setattr(self, key, value)
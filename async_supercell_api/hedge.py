@@ -0,0 +1,124 @@
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Awaitable, Callable, Collection, Deque, List, Optional
+from .response import Response
+
+
+class HedgePolicy:
+    """
+    Hedges idempotent requests: if a request gets no response within the given percentile of the recent latencies,
+    a duplicate is sent, with the least loaded key and on another connection of the pool.
+    The first response wins and the other request is cancelled.
+    
+    Hedges are limited by a budget: each request earns ``budget`` hedges, and a hedge is only sent if a whole one
+    was earned, so hedges never exceed that fraction of the requests. Up to ``burst`` unused hedges are kept.
+    
+    The number of requests, of hedges sent and of hedges that won are tracked in :attr:`requests`, :attr:`hedges`
+    and :attr:`wins`.
+    
+    :param percentile: percentile of the recent latencies after which a request is hedged. Default: 0.95
+    :param budget: maximum fraction of the requests that can be hedged. Default: 0.05
+    :param burst: maximum number of unused hedges kept. Default: 10
+    :param min_delay: lower bound of the delay before a hedge. Default: 0.05
+    :param initial_delay: delay used until enough latencies have been measured. Default: 1
+    :param window: number of recent latencies kept. Default: 1000
+    :param methods: idempotent methods that can be hedged. Default: GET, HEAD
+    :type percentile: float
+    :type budget: float
+    :type burst: int
+    :type min_delay: float
+    :type initial_delay: float
+    :type window: int
+    :type methods: Collection[str]
+    """
+    
+    def __init__(self, percentile: float = 0.95, budget: float = 0.05, burst: int = 10, min_delay: float = 0.05,
+                 initial_delay: float = 1, window: int = 1000, methods: Collection[str] = ('GET', 'HEAD')):
+        if not 0 < percentile < 1:
+            raise ValueError('percentile must be between 0 and 1')
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.methods = frozenset(method.upper() for method in methods)
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self._tokens = 0.0
+        self._latencies: Deque[float] = deque(maxlen = window)
+        self._delay = initial_delay
+        self._stale = 0
+    
+    def observe(self, latency: float) -> None:
+        """
+        Records the latency of a request.
+        
+        :param latency: seconds
+        :type latency: float
+        """
+        
+        self._latencies.append(latency)
+        self._stale += 1
+    
+    @property
+    def delay(self) -> float:
+        """
+        Seconds to wait for a response before sending a hedge.
+        
+        :rtype: float
+        """
+        
+        # sorting is amortized over several requests
+        if self._stale >= 16 or (self._stale and len(self._latencies) < 16):
+            self._stale = 0
+            if len(self._latencies) >= 16:
+                latencies = sorted(self._latencies)
+                self._delay = latencies[min(len(latencies) - 1, int(len(latencies) * self.percentile))]
+        return max(self.min_delay, self._delay)
+    
+    async def run(self, send: Callable[[], Awaitable[Response]], method: str = 'GET') -> Response:
+        """
+        Calls ``send``, and calls it again if it takes longer than :attr:`delay` and the budget allows it.
+        Returns the first response, or raises the error of the last request if all of them failed.
+        
+        :param send: coroutine function sending the request
+        :param method: method of the request. Other methods than the hedged ones are sent once
+        :type send: Callable[[], Awaitable[:class:`~async_supercell_api.response.Response`]]
+        :type method: str
+        :rtype: :class:`~async_supercell_api.response.Response`
+        """
+        
+        if method.upper() not in self.methods:
+            return await send()
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.budget)
+        start = monotonic()
+        first = asyncio.ensure_future(send())
+        tasks: List[asyncio.Future] = [first]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout = self.delay)
+            if not done and self._tokens >= 1:
+                self._tokens -= 1
+                self.hedges += 1
+                tasks.append(asyncio.ensure_future(send()))
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled():
+                        continue
+                    if task.exception() is None:
+                        # when the hedge wins, the first request took at least this long
+                        self.observe(monotonic() - start)
+                        if task is not first:
+                            self.wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error or asyncio.CancelledError()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
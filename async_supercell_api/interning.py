@@ -0,0 +1,107 @@
+from functools import partial
+from typing import Any, Dict
+from .decoding import Decoder
+
+
+class Interner:
+    """
+    Bounded table of strings, used to make identical strings of the decoded responses share a single object.
+    Names of cards, game modes and arenas, roles and tags are repeated in almost every response,
+    so keeping many responses in memory costs much less once their strings are interned.
+    
+    The table is emptied when it's full, so it follows the strings that are currently common
+    without growing forever. Strings already interned are not affected.
+    
+    To intern the responses read from a :class:`~async_supercell_api.cache.SQLiteCache`,
+    pass ``interner.wrap(loads)`` as its decoder.
+    
+    :param max_size: maximum number of strings in the table. Default: 65536
+    :param max_length: longer strings, like descriptions, are never interned. Default: 64
+    :type max_size: int
+    :type max_length: int
+    """
+    
+    def __init__(self, max_size: int = 65536, max_length: int = 64):
+        self.max_size = max_size
+        self.max_length = max_length
+        self.table: Dict[str, str] = {}
+        self.resets = 0
+    
+    def __call__(self, string: str) -> str:
+        """
+        Returns the interned copy of a string.
+        
+        :param string:
+        :type string: str
+        :rtype: str
+        """
+        
+        if len(string) > self.max_length:
+            return string
+        interned = self.table.get(string)
+        if interned is None:
+            if len(self.table) >= self.max_size:
+                self.table.clear()
+                self.resets += 1
+            interned = self.table[string] = string
+        return interned
+    
+    def walk(self, data: Any) -> Any:
+        """
+        Replaces in place the strings contained in the dicts and lists of decoded JSON with their interned copies.
+        Keys are left untouched, as the JSON decoders already reuse them. Returns the same data.
+        
+        :param data:
+        :type data: Any
+        :rtype: Any
+        """
+        
+        table = self.table
+        max_length = self.max_length
+        stack = [data]
+        while stack:
+            obj = stack.pop()
+            t = type(obj)
+            if t is dict:
+                items = obj.items()
+            elif t is list:
+                items = enumerate(obj)
+            else:
+                continue
+            for key, value in items:
+                t = type(value)
+                if t is str:
+                    if len(value) <= max_length:
+                        interned = table.get(value)
+                        if interned is None:
+                            if len(table) >= self.max_size:
+                                table.clear()
+                                self.resets += 1
+                            table[value] = value
+                        elif interned is not value:
+                            obj[key] = interned
+                elif t is dict or t is list:
+                    stack.append(value)
+        return data
+    
+    def wrap(self, decoder: Decoder) -> Decoder:
+        """
+        Returns a decoder interning the strings of the data decoded by the given one.
+        
+        :param decoder:
+        :type decoder: Callable[[bytes], Any]
+        :rtype: Callable[[bytes], Any]
+        """
+        
+        return partial(_decode, self, decoder)
+    
+    def __len__(self):
+        return len(self.table)
+    
+    def __getstate__(self):
+        # decoders are sent to process pools with their interner: the table stays in this process
+        return {'max_size': self.max_size, 'max_length': self.max_length, 'table': {}, 'resets': 0}
+
+
+def _decode(interner: Interner, decoder: Decoder, body: bytes) -> Any:
+    return interner.walk(decoder(body))
@@ -0,0 +1,118 @@
+from typing import List, Optional, Sequence
+from .ratelimit import RateLimiter
+from .response import Response
+
+
+class APIKey:
+    """
+    State of a single key inside a :class:`KeyPool`.
+    
+    :param key:
+    :param rate_limiter: limiter shared by all the clients using this key, if any
+    :type key: str
+    :type rate_limiter: Optional[:class:`~async_supercell_api.ratelimit.RateLimiter`]
+    """
+    
+    def __init__(self, key: str, rate_limiter: Optional[RateLimiter] = None):
+        self.key = key
+        self.rate_limiter = rate_limiter
+        self.enabled = True
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.denied = 0
+    
+    def load(self) -> float:
+        """
+        Returns the number of pending requests, weighted by the current refill rate of the key.
+        
+        :rtype: float
+        """
+        
+        if self.rate_limiter is None:
+            return self.in_flight
+        return self.in_flight / self.rate_limiter.current_rate
+    
+    def __repr__(self):
+        return f'{type(self).__name__}(...{self.key[-6:]}, enabled = {self.enabled}, in_flight = {self.in_flight})'
+
+
+class KeyPool:
+    """
+    Spreads requests over several API keys, always choosing the least loaded one.
+    Keys receiving a 403 or an ``accessDenied`` error are taken out of rotation, unless they are the last ones left.
+    
+    :param keys:
+    :param rate_limit: maximum requests per second sent with each key. None disables throttling. Default: None
+    :param burst: maximum number of requests sent at once with each key. Default: max(1, rate_limit)
+    :type keys: Sequence[str]
+    :type rate_limit: Optional[float]
+    :type burst: Optional[int]
+    """
+    
+    def __init__(self, keys: Sequence[str], rate_limit: Optional[float] = None, burst: Optional[int] = None):
+        if not keys:
+            raise ValueError('at least one key is needed')
+        self.keys: List[APIKey] = [
+            APIKey(key, None if rate_limit is None else RateLimiter.for_key(key, rate_limit, burst)) for key in keys
+        ]
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    @property
+    def enabled(self) -> List[APIKey]:
+        """
+        Keys currently in rotation.
+        
+        :rtype: List[:class:`APIKey`]
+        """
+        
+        return [key for key in self.keys if key.enabled]
+    
+    async def acquire(self) -> APIKey:
+        """
+        Chooses the least loaded key and waits until its rate limiter allows a new request.
+        Every call must be followed by a call to :meth:`release`.
+        
+        :rtype: :class:`APIKey`
+        """
+        
+        key = min(self.enabled, key = lambda k: (k.load(), k.requests))
+        key.in_flight += 1
+        key.requests += 1
+        if key.rate_limiter is not None:
+            try:
+                await key.rate_limiter.acquire()
+            except BaseException:
+                key.in_flight -= 1
+                raise
+        return key
+    
+    def release(self, key: APIKey, response: Optional[Response] = None) -> None:
+        """
+        Gives back a key obtained with :meth:`acquire`, updating its state from the response.
+        
+        :param key:
+        :param response: response received with the key, None if the request failed
+        :type key: :class:`APIKey`
+        :type response: Optional[:class:`~async_supercell_api.response.Response`]
+        """
+        
+        key.in_flight -= 1
+        if response is None:
+            return
+        status = response.status
+        reason = response.data.get('reason') if status >= 400 and isinstance(response.data, dict) else None
+        if status == 403 or (reason or '').startswith('accessDenied'):
+            key.denied += 1
+            if key.enabled and len(self.enabled) > 1:
+                key.enabled = False
+        elif key.rate_limiter is not None:
+            if status == 429:
+                key.throttled += 1
+                key.rate_limiter.throttled(response.retry_after)
+            else:
+                key.rate_limiter.succeeded()
+        elif status == 429:
+            key.throttled += 1
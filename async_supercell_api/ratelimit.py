@@ -0,0 +1,107 @@
+import asyncio
+from time import monotonic
+from typing import Optional
+from weakref import WeakValueDictionary
+
+
+class RateLimiter:
+    """
+    Async token bucket limiting the number of requests per second.
+    Callers waiting for a token are served in FIFO order.
+    
+    The refill rate adapts to the API: it's halved every time a request gets throttled (status 429)
+    and is restored step by step, up to the configured rate, by the following successful requests.
+    
+    :param rate: requests per second
+    :param burst: maximum number of requests that can be sent at once. Default: max(1, rate)
+    :param min_rate: lower bound for the refill rate when throttled. Default: rate / 16
+    :type rate: float
+    :type burst: Optional[int]
+    :type min_rate: Optional[float]
+    """
+    
+    def __init__(self, rate: float, burst: Optional[int] = None, min_rate: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.burst = max(1, int(rate)) if burst is None else burst
+        self.min_rate = rate / 16 if min_rate is None else min_rate
+        self.current_rate = rate
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+    
+    @classmethod
+    def for_key(cls, api_key: str, rate: float, burst: Optional[int] = None,
+                min_rate: Optional[float] = None) -> 'RateLimiter':
+        """
+        Returns the limiter shared by all the clients using the given key, creating it if needed.
+        Rate and burst are only used when the limiter is created.
+        
+        :param api_key:
+        :param rate:
+        :param burst:
+        :param min_rate:
+        :type api_key: str
+        :type rate: float
+        :type burst: Optional[int]
+        :type min_rate: Optional[float]
+        :rtype: :class:`RateLimiter`
+        """
+        
+        limiter = _limiters.get(api_key)
+        if limiter is None:
+            limiter = _limiters[api_key] = cls(rate, burst, min_rate)
+        return limiter
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.current_rate)
+        self._updated = now
+    
+    async def acquire(self) -> None:
+        """
+        Waits until a request can be sent.
+        """
+        
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                elif self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.current_rate)
+                else:
+                    self._tokens -= 1
+                    return
+    
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Notifies the limiter that a request was throttled: the bucket is emptied and the refill rate halved.
+        
+        :param retry_after: seconds to wait before sending the next request, if known
+        :type retry_after: Optional[float]
+        """
+        
+        now = monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        self.current_rate = max(self.min_rate, self.current_rate / 2)
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+    
+    def succeeded(self) -> None:
+        """
+        Notifies the limiter that a request was not throttled, slowly restoring the refill rate.
+        """
+        
+        if self.current_rate < self.rate:
+            now = monotonic()
+            self._refill(now)
+            self.current_rate = min(self.rate, self.current_rate + self.rate / 16)
+
+
+_limiters: 'WeakValueDictionary[str, RateLimiter]' = WeakValueDictionary()
@@ -0,0 +1,137 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Iterator, Mapping, Optional
+from .decoding import loads
+
+_UNDECODED = object()
+
+
+class Response:
+    """
+    Response of the API, before being converted to objects.
+    It can be unpacked like a ``(status, json)`` tuple.
+    
+    If ``data`` is not given, the body is decoded on first access to :attr:`data`.
+    Bodies of error responses that are not valid JSON, like the error pages of proxies, are decoded as None.
+    
+    :param status: HTTP status
+    :param data: decoded JSON body
+    :param headers: response headers
+    :param body: raw body
+    :param decoder: function used to decode the body. Default: the fastest installed JSON decoder
+    :type status: int
+    :type data: Any
+    :type headers: Optional[Mapping[str, str]]
+    :type body: bytes
+    :type decoder: Optional[Callable[[bytes], Any]]
+    """
+    
+    __slots__ = ('status', '_data', 'headers', 'body', 'decoder')
+    
+    def __init__(self, status: int, data: Any = _UNDECODED, headers: Optional[Mapping[str, str]] = None,
+                 body: bytes = b'', decoder: Optional[Callable[[bytes], Any]] = None):
+        self.status = status
+        self._data = data
+        self.headers = {} if headers is None else headers
+        self.body = body
+        self.decoder = loads if decoder is None else decoder
+    
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the status is 2xx.
+        
+        :rtype: bool
+        """
+        
+        return 200 <= self.status < 300
+    
+    @property
+    def decoded(self) -> bool:
+        """
+        Whether the body has already been decoded.
+        
+        :rtype: bool
+        """
+        
+        return self._data is not _UNDECODED
+    
+    @property
+    def data(self) -> Any:
+        """
+        Decoded JSON body.
+        
+        :rtype: Any
+        """
+        
+        if self._data is _UNDECODED:
+            try:
+                self._data = self.decoder(self.body) if self.body else None
+            except ValueError:
+                if self.ok:
+                    raise
+                self._data = None
+        return self._data
+    
+    def undecoded(self) -> 'Response':
+        """
+        Returns a copy of the response without its decoded body, which will be decoded again on demand.
+        
+        :rtype: :class:`Response`
+        """
+        
+        return Response(self.status, headers = self.headers, body = self.body, decoder = self.decoder)
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter((self.status, self.data))
+    
+    def __getitem__(self, item):
+        return (self.status, self.data)[item]
+    
+    def __len__(self):
+        return 2
+    
+    def __repr__(self):
+        return f'{type(self).__name__}({self.status})'
+    
+    @property
+    def max_age(self) -> Optional[float]:
+        """
+        Seconds the response can be cached for according to the ``Cache-Control`` header, None if not specified.
+        
+        :rtype: Optional[float]
+        """
+        
+        directives = [d.strip().lower() for d in self.headers.get('Cache-Control', '').split(',')]
+        if 'no-store' in directives or 'no-cache' in directives:
+            return 0
+        for directive in directives:
+            if directive.startswith('max-age='):
+                try:
+                    return max(0.0, float(directive[8:]))
+                except ValueError:
+                    return None
+        return None
+    
+    @property
+    def retry_after(self) -> Optional[float]:
+        """
+        Seconds to wait before the next request according to the ``Retry-After`` header, None if missing or invalid.
+        
+        :rtype: Optional[float]
+        """
+        
+        value = self.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo = timezone.utc)
+        return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,100 @@
+import asyncio
+from collections import Counter
+from random import uniform
+from time import monotonic
+from typing import Awaitable, Callable, Collection, Optional
+from .response import Response
+
+
+class RetryPolicy:
+    """
+    Retries idempotent requests failed with a transient error: a timeout or one of the given statuses.
+    Delays grow exponentially with full jitter, unless the response carries a ``Retry-After`` header.
+    A ``Retry-After`` longer than ``max_delay`` ends the retries, and the response is returned.
+    Client errors like 400 and 404 are never retried.
+    
+    The number of retries is tracked in :attr:`retries` (total) and :attr:`retries_by_status`
+    (``'timeout'`` for timeouts), while :attr:`exhausted` counts requests that failed after all the attempts.
+    
+    :param max_retries: maximum number of retries for a single request. Default: 3
+    :param base_delay: delay before the first retry, doubled at each attempt. Default: 0.5
+    :param max_delay: upper bound of a single delay, including the ones asked by ``Retry-After``. Default: 30
+    :param deadline: maximum seconds spent on a request, retries included. None for no limit. Default: None
+    :param statuses: statuses to retry. Default: 429, 500, 502, 503, 504
+    :param methods: idempotent methods that can be retried. Default: GET, HEAD
+    :type max_retries: int
+    :type base_delay: float
+    :type max_delay: float
+    :type deadline: Optional[float]
+    :type statuses: Collection[int]
+    :type methods: Collection[str]
+    """
+    
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 30,
+                 deadline: Optional[float] = None, statuses: Collection[int] = (429, 500, 502, 503, 504),
+                 methods: Collection[str] = ('GET', 'HEAD')):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.retries = 0
+        self.retries_by_status = Counter()
+        self.exhausted = 0
+    
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns a random delay between 0 and ``base_delay * 2 ** attempt``, capped at ``max_delay``.
+        
+        :param attempt: number of retries already done
+        :type attempt: int
+        :rtype: float
+        """
+        
+        return uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+    
+    async def run(self, send: Callable[[], Awaitable[Response]], method: str = 'GET') -> Response:
+        """
+        Calls ``send`` until it returns a response that should not be retried, or until retries are exhausted.
+        In the latter case the last response is returned, or the last timeout is raised.
+        
+        :param send: coroutine function sending the request
+        :param method: HTTP method of the request
+        :type send: Callable[[], Awaitable[:class:`~async_supercell_api.response.Response`]]
+        :type method: str
+        :rtype: :class:`~async_supercell_api.response.Response`
+        """
+        
+        if method.upper() not in self.methods:
+            return await send()
+        start = monotonic()
+        attempt = 0
+        while True:
+            try:
+                response = await send()
+            except asyncio.TimeoutError:
+                delay = self._delay(attempt, start)
+                if delay is None:
+                    raise
+                reason = 'timeout'
+            else:
+                if response.status not in self.statuses:
+                    return response
+                delay = self._delay(attempt, start, response.retry_after)
+                if delay is None:
+                    return response
+                reason = response.status
+            self.retries += 1
+            self.retries_by_status[reason] += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    def _delay(self, attempt: int, start: float, retry_after: Optional[float] = None) -> Optional[float]:
+        delay = self.backoff(attempt) if retry_after is None else retry_after
+        if attempt >= self.max_retries or delay > self.max_delay or (
+                self.deadline is not None and monotonic() + delay - start >= self.deadline
+        ):
+            self.exhausted += 1
+            return None
+        return delay
@@ -0,0 +1,269 @@
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Any, Collection, Deque, Dict, Optional, Sequence
+
+
+class AIMD:
+    """
+    Adaptive concurrency limit: additive increase, multiplicative decrease.
+    While responses are healthy and the limit is reached, the limit grows by ``increase`` every ``limit`` responses,
+    so about once per round trip. Overload signals cut it by the ``decrease`` factor: throttling statuses,
+    failed requests and, if a target is set, responses slower than the target.
+    Only requests started after the last cut can cut it again, so a burst of errors counts once.
+    
+    :param initial: starting limit. Default: 10
+    :param min_limit: Default: 1
+    :param max_limit: Default: 200
+    :param increase: increase of the limit for each round trip without overload. Default: 1
+    :param decrease: factor applied to the limit on overload. Default: 0.5
+    :param latency_target: seconds above which a response is an overload signal. None to ignore latency.
+        Default: None
+    :param statuses: statuses that are overload signals. Default: 429 and 503
+    :type initial: int
+    :type min_limit: int
+    :type max_limit: int
+    :type increase: float
+    :type decrease: float
+    :type latency_target: Optional[float]
+    :type statuses: Collection[int]
+    """
+    
+    def __init__(self, initial: int = 10, min_limit: int = 1, max_limit: int = 200, increase: float = 1,
+                 decrease: float = 0.5, latency_target: Optional[float] = None, statuses: Collection[int] = (429, 503)):
+        if not 0 < decrease < 1:
+            raise ValueError('decrease must be between 0 and 1')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.statuses = frozenset(statuses)
+        self.limit = float(min(max_limit, max(min_limit, initial)))
+        self.increases = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+    
+    def update(self, status: Optional[int], latency: float, saturated: bool = True) -> int:
+        """
+        Updates the limit with the outcome of a request and returns it.
+        
+        :param status: status of the response, None if the request failed
+        :param latency: seconds the request took
+        :param saturated: whether the limit was reached when the request ended. The limit only grows if it was
+        :type status: Optional[int]
+        :type latency: float
+        :type saturated: bool
+        :rtype: int
+        """
+        
+        now = monotonic()
+        if (
+                status is None or status in self.statuses
+                or (self.latency_target is not None and latency > self.latency_target)
+        ):
+            if now - latency >= self._last_decrease:
+                self.limit = max(self.min_limit, self.limit * self.decrease)
+                self._last_decrease = now
+                self.decreases += 1
+        elif saturated and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            self.increases += 1
+        return int(self.limit)
+    
+    def __repr__(self):
+        return f'{type(self).__name__}(limit = {self.limit:.2f})'
+
+
+class Lane:
+    """
+    Queue of the requests with the same priority inside a :class:`Scheduler`, with its statistics.
+    
+    :param name:
+    :param priority: position of the lane, 0 being the most urgent
+    :type name: str
+    :type priority: int
+    """
+    
+    def __init__(self, name: str, priority: int):
+        self.name = name
+        self.priority = priority
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.requests = 0
+        self.queued = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+    
+    @property
+    def depth(self) -> int:
+        """
+        Number of requests currently waiting in the lane.
+        
+        :rtype: int
+        """
+        
+        return len(self.waiters)
+    
+    @property
+    def mean_wait(self) -> float:
+        """
+        Mean time in seconds waited by the requests of the lane, including the ones that didn't wait.
+        
+        :rtype: float
+        """
+        
+        return self.wait_time / self.requests if self.requests else 0.0
+    
+    def __repr__(self):
+        return f'{type(self).__name__}({self.name!r}, depth = {self.depth}, requests = {self.requests})'
+
+
+class Scheduler:
+    """
+    Limits the number of requests sent at the same time, and decides which waiting request goes next:
+    always the oldest one of the most urgent lane. Requests take their slot before choosing a key,
+    so urgent requests also jump the queues of the rate limiters and of the connection pool.
+    It can be shared by several clients, like a bot and a crawler using the same keys.
+    
+    Lanes have strict priorities: requests of a lane are only sent when the more urgent lanes are empty.
+    
+    With an ``adaptive`` controller, the limit follows the health of the API instead of being fixed, see :class:`AIMD`.
+    
+    :param concurrency: maximum number of requests sent at the same time. Default: 10
+    :param lanes: names of the lanes, from the most to the least urgent.
+        Default: ``('interactive', 'default', 'background')``
+    :param default: lane of the requests without a priority. Default: ``'default'``
+    :param adaptive: controller of the limit. ``concurrency`` is ignored if given. Default: None
+    :type concurrency: int
+    :type lanes: Sequence[str]
+    :type default: str
+    :type adaptive: Optional[:class:`AIMD`]
+    """
+    
+    def __init__(self, concurrency: int = 10, lanes: Sequence[str] = ('interactive', 'default', 'background'),
+                 default: str = 'default', adaptive: Optional[AIMD] = None):
+        if adaptive is not None:
+            concurrency = int(adaptive.limit)
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        self.lanes: Dict[str, Lane] = {name: Lane(name, priority) for priority, name in enumerate(lanes)}
+        if default not in self.lanes:
+            raise ValueError(f'unknown default lane {default!r}')
+        self.default = default
+        self.adaptive = adaptive
+        self.in_flight = 0
+        self._limit = concurrency
+    
+    @property
+    def limit(self) -> int:
+        """
+        Maximum number of requests sent at the same time. It can be changed at any time.
+        
+        :rtype: int
+        """
+        
+        return self._limit
+    
+    @limit.setter
+    def limit(self, value: int) -> None:
+        self._limit = max(1, int(value))
+        self._wake()
+    
+    @property
+    def depth(self) -> int:
+        """
+        Number of requests waiting in all the lanes.
+        
+        :rtype: int
+        """
+        
+        return sum(lane.depth for lane in self.lanes.values())
+    
+    def lane(self, name: Optional[str] = None) -> Lane:
+        """
+        Returns a lane by name, or the default one.
+        
+        :param name:
+        :type name: Optional[str]
+        :rtype: :class:`Lane`
+        """
+        
+        try:
+            return self.lanes[self.default if name is None else name]
+        except KeyError:
+            raise ValueError(f'unknown lane {name!r}, expected one of {list(self.lanes)}') from None
+    
+    async def acquire(self, lane: Optional[str] = None) -> None:
+        """
+        Waits until a request of the given lane can be sent.
+        Every call must be followed by a call to :meth:`release`.
+        
+        :param lane: name of the lane. None for the default one
+        :type lane: Optional[str]
+        """
+        
+        lane = self.lane(lane)
+        lane.requests += 1
+        if self.in_flight < self._limit and not self.depth:
+            self.in_flight += 1
+            return
+        start = monotonic()
+        waiter = asyncio.get_event_loop().create_future()
+        lane.waiters.append(waiter)
+        lane.queued += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was given right before the cancellation
+                self.release()
+            elif waiter in lane.waiters:
+                lane.waiters.remove(waiter)
+            raise
+        finally:
+            waited = monotonic() - start
+            lane.wait_time += waited
+            lane.max_wait = max(lane.max_wait, waited)
+    
+    def release(self, status: Optional[int] = None, latency: Optional[float] = None) -> None:
+        """
+        Frees the slot taken with :meth:`acquire`, giving it to the next waiting request.
+        The outcome of the request, if known, updates the adaptive limit.
+        
+        :param status: status of the response, None if the request failed
+        :param latency: seconds the request took. None if it wasn't sent or was cancelled
+        :type status: Optional[int]
+        :type latency: Optional[float]
+        """
+        
+        if self.adaptive is not None and latency is not None:
+            saturated = self.in_flight >= self._limit or self.depth > 0
+            self._limit = max(1, self.adaptive.update(status, latency, saturated))
+        self.in_flight -= 1
+        self._wake()
+    
+    def _wake(self) -> None:
+        for lane in self.lanes.values():
+            while lane.waiters and self.in_flight < self._limit:
+                waiter = lane.waiters.popleft()
+                if not waiter.done():
+                    self.in_flight += 1
+                    waiter.set_result(None)
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns, for each lane, the number of waiting requests (``depth``), of requests (``requests``)
+        and of requests that had to wait (``queued``), and the mean and maximum waits in seconds.
+        
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        
+        return {
+            name: {
+                'depth': lane.depth,
+                'requests': lane.requests,
+                'queued': lane.queued,
+                'mean_wait': lane.mean_wait,
+                'max_wait': lane.max_wait,
+            } for name, lane in self.lanes.items()
+        }
@@ -0,0 +1,403 @@
+from functools import lru_cache
+from keyword import iskeyword
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple, Type, Union
+from .types import FrozenApiResponse, SlottedApiResponse, SupercellApiResponse
+
+FieldType = Union[None, Type[SupercellApiResponse], List[Type[SupercellApiResponse]]]
+
+# canonical instances of the static types, by type and id, with the data they were built from
+flyweights: Dict[Tuple[type, Any], Tuple[Dict[str, Any], Any]] = {}
+
+
+class Field:
+    """
+    Field of an API type.
+    
+    :param name:
+    :param type: type of the nested object, None for plain JSON values
+    :param many: whether the field is a list of nested objects
+    :type name: str
+    :type type: Optional[Type[:class:`~async_supercell_api.types.SupercellApiResponse`]]
+    :type many: bool
+    """
+    
+    __slots__ = ('name', 'type', 'many')
+    
+    def __init__(self, name: str, type: Optional[Type[SupercellApiResponse]] = None, many: bool = False):
+        self.name = name
+        self.type = type
+        self.many = many
+    
+    def __repr__(self):
+        if self.type is None:
+            return self.name
+        return f'{self.name}: {"[" * self.many}{self.type.__name__}{"]" * self.many}'
+
+
+class Schema:
+    """
+    Declarative description of an API type: its fields in order, with the types of the nested objects.
+    
+    :param cls: described type
+    :param fields: for each field, None for plain JSON values, a type for nested objects
+        or a list containing a type for lists of nested objects
+    :type cls: Type[:class:`~async_supercell_api.types.SupercellApiResponse`]
+    :type fields: Dict[str, Any]
+    """
+    
+    def __init__(self, cls: Type[SupercellApiResponse], fields: Dict[str, FieldType]):
+        self.cls = cls
+        self.fields = tuple(
+            Field(name, spec[0], True) if isinstance(spec, list) else Field(name, spec) for name, spec in fields.items()
+        )
+        self.names = frozenset(field.name for field in self.fields)
+    
+    def __repr__(self):
+        return f'{type(self).__name__}({self.cls.__name__}, {list(self.fields)})'
+
+
+def define_schemas(schemas: Dict[Type[SupercellApiResponse], Dict[str, FieldType]],
+                   static: Collection[type] = ()) -> None:
+    """
+    Attaches a :class:`Schema` to each type, as ``_schema``, and creates its compact variant, as ``Slotted``.
+    Both the type and its variant get ``__init__``, ``from_dict``, ``to_dict`` and the binary serialization
+    compiled from the schema, see :func:`compile_schema`, so the schema is the only declaration of the fields:
+    types only declare their name and documentation.
+    
+    Both also get a shared variant, as ``Shared``, that builds the nested objects of the static types
+    as flyweights: a single immutable instance, shared by all the responses, for each distinct value with the same id.
+    The shared variants of the static types are :class:`~async_supercell_api.types.FrozenApiResponse`.
+    Static types must have an ``id`` field and few distinct values, as their instances are never released.
+    
+    :param schemas: fields of each type, see :class:`Schema`
+    :param static: types describing a small fixed set of values, like arenas or locations
+    :type schemas: Dict[Type[:class:`~async_supercell_api.types.SupercellApiResponse`], Dict[str, Any]]
+    :type static: Collection[type]
+    """
+    
+    namespaces = []
+    for cls, fields in schemas.items():
+        schema = cls._schema = Schema(cls, fields)
+        for field in schema.fields:
+            if iskeyword(field.name) or field.name in ('self', 'extra', 'kwargs'):
+                raise ValueError(f'invalid field name {field.name!r} in {cls.__qualname__}')
+        cls.Slotted = type(cls.__name__, (SlottedApiResponse,), {
+            '__slots__': tuple(field.name for field in schema.fields),
+            '__module__': cls.__module__,
+            '__qualname__': f'{cls.__qualname__}.Slotted',
+            '__doc__': f'Compact variant of :class:`{cls.__qualname__}`, see '
+                       f':class:`~async_supercell_api.types.SlottedApiResponse`.',
+            '_schema': schema,
+        })
+        for base in (cls, cls.Slotted):
+            base.Shared = type(cls.__name__, (base, FrozenApiResponse) if cls in static else (base,), {
+                '__slots__': (),
+                '__module__': cls.__module__,
+                '__qualname__': f'{base.__qualname__}.Shared',
+                '__doc__': f'Shared variant of :class:`{base.__qualname__}`, '
+                           f'see :func:`~async_supercell_api.schema.define_schemas`.',
+                '_shared': True,
+                # the compiled constructors of the bases would modify the canonical instances
+                **({'__init__': FrozenApiResponse.__init__} if cls in static else {}),
+            })
+        for slotted in (False, True):
+            for shared in (False, True):
+                target = variant(cls, slotted, shared)
+                namespace = compile_schema(schema, slotted)
+                if shared and cls in static:
+                    base = variant(cls, slotted)
+                    target.from_dict = classmethod(_flyweight(base, namespace['from_dict']))
+                    target._from_tuple = classmethod(_flyweight_from_tuple(base))
+                else:
+                    target.from_dict = classmethod(namespace['from_dict'])
+                    target._from_tuple = classmethod(namespace['_from_tuple'])
+                    target.__init__ = namespace['__init__']
+                    if not shared:
+                        target.to_dict = namespace['to_dict']
+                        target._to_tuple = namespace['_to_tuple']
+                namespaces.append((schema, slotted, shared, namespace))
+    # nested types can be defined later in the same module, so constructors are bound at the end
+    for schema, slotted, shared, namespace in namespaces:
+        for i, field in enumerate(schema.fields):
+            if field.type is not None:
+                namespace[f'_from_dict_{i}'] = variant(field.type, slotted, shared).from_dict
+                namespace[f'_from_tuple_{i}'] = variant(field.type, slotted, shared)._from_tuple
+
+
+def _flyweight(base: type, build: Callable[[type, Dict[str, Any]], Any]) -> Callable[[type, Dict[str, Any]], Any]:
+    def from_dict(cls, data):
+        key = (cls, data.get('id'))
+        entry = flyweights.get(key)
+        if entry is not None and entry[0] == data:
+            return entry[1]
+        # built as a mutable object, then frozen
+        obj = build(base, data)
+        obj.__class__ = cls
+        if key[1] is not None:
+            flyweights[key] = (data, obj)
+        return obj
+    
+    return from_dict
+
+
+def _flyweight_from_tuple(base: type) -> Callable[[type, tuple], Any]:
+    def from_tuple(cls, values):
+        # the registry compares the decoded JSON
+        return cls.from_dict(base._from_tuple(values).to_dict())
+    
+    return from_tuple
+
+
+def compile_schema(schema: Schema, slotted: bool = False) -> Dict[str, Any]:
+    """
+    Generates and compiles straight-line constructors for a type, without keyword arguments unpacking
+    and with a single call for each nested object.
+    Returns the namespace of the generated code, with ``from_dict(cls, data)``, ``to_dict(self)``,
+    the conversions to and from positional tuples used by the binary serialization, ``_to_tuple(self)``
+    and ``_from_tuple(cls, values)``, and ``__init__(self, ...)``, taking the fields as keyword arguments
+    and building the nested objects from their dicts.
+    Nested objects are built by the ``_from_dict_<index of the field>`` and ``_from_tuple_<index of the field>``
+    globals, that must be set by the caller.
+    
+    :param schema:
+    :param slotted: whether to generate the code of the compact variant
+    :type schema: :class:`Schema`
+    :type slotted: bool
+    :rtype: Dict[str, Any]
+    """
+    
+    def build(i: int, field: Field, name: str) -> str:
+        if field.type is None:
+            return name
+        if field.many:
+            return f'None if {name} is None else [_from_dict_{i}(x) for x in {name}]'
+        return f'None if {name} is None else _from_dict_{i}({name})'
+    
+    def read(name: str) -> str:
+        # fields left unset by a projection are read as None
+        return f'_getattr(self, {name!r}, None)' if slotted else f'get({name!r})'
+    
+    lines = ['def from_dict(cls, data):', '    self = _new(cls)', '    get = data.get']
+    if not slotted:
+        lines.append('    self._SupercellApiResponse__success = True')
+        lines.append('    if not _names.issuperset(data):')
+        lines.append('        for key, value in data.items():')
+        lines.append('            if key not in _names:')
+        lines.append('                setattr(self, key, value)')
+    for i, field in enumerate(schema.fields):
+        if field.type is None:
+            lines.append(f'    self.{field.name} = get({field.name!r})')
+        else:
+            lines.append(f'    value = get({field.name!r})')
+            lines.append(f'    self.{field.name} = {build(i, field, "value")}')
+    if slotted:
+        lines.append('    self.extra = None if _names.issuperset(data) else '
+                     '{key: value for key, value in data.items() if key not in _names}')
+        lines.append('    return self')
+        lines.append(f'def __init__(self, {"".join(f"{field.name}=None, " for field in schema.fields)}**extra):')
+        for i, field in enumerate(schema.fields):
+            lines.append(f'    self.{field.name} = {build(i, field, field.name)}')
+        lines.append('    self.extra = extra or None')
+    else:
+        lines.append('    return self')
+        lines.append(f'def __init__(self, {"".join(f"{field.name}=None, " for field in schema.fields)}**kwargs):')
+        lines.append('    _init(self, **kwargs)')
+        for i, field in enumerate(schema.fields):
+            lines.append(f'    self.{field.name} = {build(i, field, field.name)}')
+    lines.append('def to_dict(self):')
+    if not slotted:
+        lines.append('    get = self.__dict__.get')
+    lines.append('    data = {}')
+    for i, field in enumerate(schema.fields):
+        lines.append(f'    value = {read(field.name)}')
+        lines.append('    if value is not None:')
+        if field.type is None:
+            lines.append(f'        data[{field.name!r}] = value')
+        elif field.many:
+            lines.append(f'        data[{field.name!r}] = [x.to_dict() for x in value]')
+        else:
+            lines.append(f'        data[{field.name!r}] = value.to_dict()')
+    if slotted:
+        lines.append('    if self.extra:')
+        lines.append('        data.update(self.extra)')
+    else:
+        lines.append('    if len(self.__dict__) > _size:')
+        lines.append('        for key, value in self.__dict__.items():')
+        lines.append('            if key not in _names and key != "_SupercellApiResponse__success":')
+        lines.append('                data[key] = value')
+    lines.append('    return data')
+    lines.append('def _to_tuple(self):')
+    if not slotted:
+        lines.append('    get = self.__dict__.get')
+    values = []
+    for i, field in enumerate(schema.fields):
+        lines.append(f'    v{i} = {read(field.name)}')
+        if field.type is None:
+            values.append(f'v{i}')
+        elif field.many:
+            values.append(f'None if v{i} is None else [x._to_tuple() for x in v{i}]')
+        else:
+            values.append(f'None if v{i} is None else v{i}._to_tuple()')
+    if slotted:
+        values.append('self.extra')
+    else:
+        lines.append('    extra = None')
+        lines.append('    if len(self.__dict__) > _size:')
+        lines.append('        extra = {key: value for key, value in self.__dict__.items() '
+                     'if key not in _names and key != "_SupercellApiResponse__success"} or None')
+        values.append('extra')
+    lines.append(f'    return ({", ".join(values)},)')
+    lines.extend(['def _from_tuple(cls, values):', '    self = _new(cls)'])
+    if not slotted:
+        lines.append('    self._SupercellApiResponse__success = True')
+        lines.append(f'    if values[{len(schema.fields)}]:')
+        lines.append(f'        for key, value in values[{len(schema.fields)}].items():')
+        lines.append('            setattr(self, key, value)')
+    for i, field in enumerate(schema.fields):
+        if field.type is None:
+            lines.append(f'    self.{field.name} = values[{i}]')
+        else:
+            lines.append(f'    value = values[{i}]')
+            if field.many:
+                lines.append(f'    self.{field.name} = None if value is None else [_from_tuple_{i}(x) for x in value]')
+            else:
+                lines.append(f'    self.{field.name} = None if value is None else _from_tuple_{i}(value)')
+    if slotted:
+        lines.append(f'    self.extra = values[{len(schema.fields)}]')
+    lines.append('    return self')
+    namespace = {
+        '_new': object.__new__, '_getattr': getattr, '_names': schema.names, '_size': len(schema.fields) + 1,
+        '_init': SupercellApiResponse.__init__,
+    }
+    variant_name = f'{schema.cls.__qualname__}{".Slotted" if slotted else ""}'
+    exec(compile('\n'.join(lines), f'<schema of {variant_name}>', 'exec'), namespace)
+    return namespace
+
+
+def variant(cls: Optional[type], slotted: bool = False, shared: bool = False) -> Optional[type]:
+    """
+    Returns the compact variant of a type if ``slotted`` is True, and the shared variant of that if ``shared`` is True,
+    when the type has them, otherwise the type itself.
+    
+    :param cls:
+    :param slotted:
+    :param shared:
+    :type cls: Optional[type]
+    :type slotted: bool
+    :type shared: bool
+    :rtype: Optional[type]
+    """
+    
+    if slotted:
+        cls = getattr(cls, 'Slotted', cls)
+    if shared:
+        cls = getattr(cls, 'Shared', cls)
+    return cls
+
+
+class Projection:
+    """
+    Builds objects of a type, or of its compact variant, with only some of their fields.
+    Nested fields are selected with dotted paths, like ``'clan.tag'``: a nested object selected without a path
+    is built entirely, while the ones not selected are never built. Fields not selected are not set at all,
+    so reading them raises :class:`AttributeError`, and fields unknown to the schema are dropped.
+    It can be used everywhere a type is expected to build objects, as it provides a ``from_dict`` method.
+    
+    :param cls: type of the objects, with a schema
+    :param fields: names of the fields to build, or dotted paths for nested fields
+    :type cls: type
+    :type fields: Iterable[str]
+    """
+    
+    __slots__ = ('cls', 'fields', '_slotted', '_shared', '_plan')
+    
+    def __init__(self, cls: type, fields: Iterable[str]):
+        self.cls = cls
+        self.fields = tuple(sorted(set(fields)))
+        tree: Dict[str, Any] = {}
+        for path in self.fields:
+            node = tree
+            *parents, name = path.split('.')
+            for parent in parents:
+                node = node.setdefault(parent, {})
+                if node is None:
+                    break
+            else:
+                node[name] = None
+        self._compile(tree)
+    
+    @classmethod
+    def _from_tree(cls, target: type, tree: Dict[str, Any]) -> 'Projection':
+        self = object.__new__(cls)
+        self.cls = target
+        self.fields = None
+        self._compile(tree)
+        return self
+    
+    def _compile(self, tree: Dict[str, Any]) -> None:
+        schema: Optional[Schema] = getattr(self.cls, '_schema', None)
+        if schema is None:
+            raise TypeError(f'{self.cls.__qualname__} has no schema')
+        self._slotted = issubclass(self.cls, SlottedApiResponse)
+        self._shared = getattr(self.cls, '_shared', False)
+        for name in tree:
+            if name not in schema.names:
+                raise ValueError(f'{self.cls.__qualname__} has no field {name!r}')
+        self._plan: List[Tuple[str, Optional[Callable[[Any], Any]], bool]] = []
+        for field in schema.fields:
+            if field.name not in tree:
+                continue
+            name, subtree = field.name, tree[field.name]
+            if field.type is None:
+                if subtree is not None:
+                    raise ValueError(f'field {name!r} of {self.cls.__qualname__} has no nested fields')
+                self._plan.append((name, None, False))
+            else:
+                nested = variant(field.type, self._slotted, self._shared)
+                build = nested.from_dict if subtree is None else Projection._from_tree(nested, subtree).from_dict
+                self._plan.append((name, build, field.many))
+    
+    def from_dict(self, data: Dict[str, Any]) -> Any:
+        """
+        Builds an object with the selected fields from its decoded JSON.
+        
+        :param data:
+        :type data: Dict[str, Any]
+        :rtype: Any
+        """
+        
+        obj = object.__new__(self.cls)
+        # shared variants of static types can't be modified with setattr
+        set_field = object.__setattr__
+        if self._slotted:
+            set_field(obj, 'extra', None)
+        else:
+            set_field(obj, '_SupercellApiResponse__success', True)
+        get = data.get
+        for name, build, many in self._plan:
+            value = get(name)
+            if build is not None and value is not None:
+                value = [build(x) for x in value] if many else build(value)
+            set_field(obj, name, value)
+        return obj
+    
+    def __reduce__(self):
+        return projection, (self.cls, self.fields)
+    
+    def __repr__(self):
+        return f'{type(self).__name__}({self.cls.__qualname__}, {list(self.fields or ())})'
+
+
+@lru_cache(maxsize = 256)
+def projection(cls: type, fields: Tuple[str, ...]) -> Projection:
+    """
+    Returns the :class:`Projection` of a type on the given fields, reusing the ones already created.
+    
+    :param cls:
+    :param fields:
+    :type cls: type
+    :type fields: Tuple[str, ...]
+    :rtype: :class:`Projection`
+    """
+    
+    return Projection(cls, fields)
@@ -0,0 +1,62 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ('task', 'waiters')
+    
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: while a call with a given key is running,
+    other callers with the same key wait for its result instead of starting a new one.
+    The shared call is cancelled only when all its callers have been cancelled.
+    
+    The number of calls that were served by another call is counted in :attr:`coalesced`.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self.coalesced = 0
+    
+    def __len__(self):
+        return len(self._calls)
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the result of ``func()``, sharing it with all the concurrent calls with the same key.
+        
+        :param key:
+        :param func: coroutine function to call if no call with the same key is running
+        :type key: Hashable
+        :type func: Callable[[], Awaitable[Any]]
+        :rtype: Any
+        """
+        
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _Call(asyncio.ensure_future(func()))
+            call.task.add_done_callback(lambda task: self._done(key, call))
+        else:
+            self.coalesced += 1
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # the task can take several iterations to unwind: later callers must not join it
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.task.cancel()
+    
+    def _done(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            # the exception has already been propagated to the callers, if any
+            call.task.exception()
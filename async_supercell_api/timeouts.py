@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Iterator, Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar('deadline', default = None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Gives a single time budget to all the requests made inside the block, including the ones made by tasks
+    created inside it, like :meth:`~async_supercell_api.api.SupercellAPI.bulk`.
+    Requests still running when the budget is over are cancelled, releasing their connections, keys
+    and scheduler slots, and raise :class:`asyncio.TimeoutError`; later requests fail immediately.
+    Nested blocks can only shorten the budget of the outer ones.
+    
+    Example::
+        
+        with deadline(10):
+            clan = await api.get_clan(tag)
+            async for member_tag, player in api.get_players(member.tag for member in clan.memberList):
+                ...
+    
+    :param seconds: budget of the block
+    :type seconds: float
+    :return: the time the budget ends, on the :func:`time.monotonic` clock
+    :rtype: Iterator[float]
+    """
+    
+    end = monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        end = min(end, outer)
+    token = _deadline.set(end)
+    try:
+        yield end
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Returns the seconds left before the current deadline, possibly negative, or None if there is no deadline.
+    
+    :rtype: Optional[float]
+    """
+    
+    end = _deadline.get()
+    return None if end is None else end - monotonic()
@@ -1,4 +1,13 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+import marshal
+from importlib import import_module
+from io import StringIO
+from itertools import chain, islice
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Type, TypeVar, \
+    Union, overload
+
+# limits of the representations returned by repr()
+REPR_MAX_DEPTH = 2
+REPR_MAX_ITEMS = 10
 
 
 class SupercellApiResponse:
@@ -14,56 +23,301 @@ class SupercellApiResponse:
         for key, value in kwargs.items():
             setattr(self, key, value)
     
-    def to_string(self, *, level: int = 0, sep = '    ', nl: str = '\n'):
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """
+        Builds an object from its decoded JSON. Types with a schema replace this with a faster compiled constructor.
+        
+        :param data:
+        :type data: Dict[str, Any]
+        """
+        
+        return cls(**data)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the object back to decoded JSON, omitting the fields that are None.
+        Plain values, like lists of numbers or dicts of URLs, are not copied.
+        Types with a schema replace this with a faster compiled method.
+        
+        :rtype: Dict[str, Any]
+        """
+        
+        def convert(value):
+            if isinstance(value, (SupercellApiResponse, SlottedApiResponse)):
+                return value.to_dict()
+            if isinstance(value, (list, LazyList)):
+                return [convert(x) for x in value]
+            return value
+        
+        return {name: convert(value) for name, value in self._fields() if value is not None}
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the object to a compact binary format, that can be loaded back with :meth:`from_bytes`
+        much faster than the JSON it was built from. Only available for the types with a schema.
+        The format is meant for caches and processes of the same versions of Python and of this library,
+        as it depends on both, and it's loaded without any validation.
+        Pages are supported too, if their items have a schema.
+        
+        :rtype: bytes
+        """
+        
+        return marshal.dumps(self._to_tuple())
+    
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Loads an object serialized with :meth:`to_bytes`.
+        
+        :param data:
+        :type data: bytes
+        """
+        
+        return cls._from_tuple(marshal.loads(data))
+    
+    def _to_tuple(self) -> tuple:
+        raise TypeError(f'{type(self).__name__} has no schema')
+    
+    @classmethod
+    def _from_tuple(cls, values: tuple):
+        raise TypeError(f'{cls.__name__} has no schema')
+    
+    def to_string(self, *, level: int = 0, sep = '    ', nl: str = '\n', max_depth: Optional[int] = None,
+                  max_items: Optional[int] = None) -> str:
         """
         Returns a prettified string representation of the object.
-
+        
         :param level: starting level of indentation. Default: 0
         :param sep: character sequence for indentation. Default: 4 spaces
         :param nl: new line sequence. Default '\\n'
+        :param max_depth: nested objects and lists deeper than this are shortened, like ``Clan(...)``.
+            None for no limit. Default: None
+        :param max_items: maximum number of items shown for each list. None for no limit. Default: None
         :type level: int
         :type sep: str
         :type nl: str
+        :type max_depth: Optional[int]
+        :type max_items: Optional[int]
+        :rtype: str
         """
         
-        def recursion(obj, level: int = level, sep = sep) -> str:
-            if isinstance(obj, SupercellApiResponse):
-                return obj.to_string(level = level + 1, sep = sep)
-            if isinstance(obj, list):
-                return f'[{nl}{sep * (level + 2)}' + (
-                    f',{nl}{sep * (level + 2)}'.join(
-                        map(lambda x: recursion(x, level + 1, sep), obj)
-                    )) + f'\n{sep * (level + 1)}]'
-            return str(obj)
-        
-        to_skip = ['_SupercellApiResponse__success']
-        return '{}({}{}{}{}{})'.format(
-            type(self).__name__,
-            nl,
-            sep * (level + 1),
-            f',{nl}{sep * (level + 1)}'.join(
-                '{} = {}'.format(*item) for item in map(
-                    lambda x: (x[0], recursion(x[1])),
-                    filter(lambda x: x[0] not in to_skip and x[1] is not None, vars(self).items())
-                )
-            ),
-            nl,
-            sep * level,
-        )
+        stream = StringIO()
+        self.write_string(stream, level = level, sep = sep, nl = nl, max_depth = max_depth, max_items = max_items)
+        return stream.getvalue()
+    
+    def write_string(self, stream: TextIO, *, level: int = 0, sep = '    ', nl: str = '\n',
+                     max_depth: Optional[int] = None, max_items: Optional[int] = None) -> None:
+        """
+        Writes the same representation as :meth:`to_string` to a text stream, piece by piece,
+        without building the whole string in memory and without recursion.
+        
+        :param stream: a text file, :class:`io.StringIO` or any object with a ``write(str)`` method
+        :param level: see :meth:`to_string`
+        :param sep: see :meth:`to_string`
+        :param nl: see :meth:`to_string`
+        :param max_depth: see :meth:`to_string`
+        :param max_items: see :meth:`to_string`
+        :type stream: TextIO
+        :type level: int
+        :type sep: str
+        :type nl: str
+        :type max_depth: Optional[int]
+        :type max_items: Optional[int]
+        """
+        
+        write = stream.write
+        # objects and lists being written: [children, separator, closing, indent and depth of the children, started]
+        stack: List[list] = []
+        
+        def begin(value: Any, indent: int, depth: int) -> None:
+            # objects are written at level indent + 1, lists at level indent
+            if isinstance(value, (SupercellApiResponse, SlottedApiResponse)):
+                name = type(value).__name__
+                if max_depth is not None and depth > max_depth:
+                    write(f'{name}(...)')
+                    return
+                children = ((key, item) for key, item in value._fields() if item is not None)
+                write(f'{name}({nl}{sep * (indent + 2)}')
+                stack.append([children, f',{nl}{sep * (indent + 2)}', f'{nl}{sep * (indent + 1)})', indent + 1,
+                              depth + 1, False])
+            elif isinstance(value, (list, LazyList)):
+                if max_depth is not None and depth > max_depth:
+                    write(f'[...{len(value)} items]')
+                    return
+                children = ((None, item) for item in value)
+                if max_items is not None and len(value) > max_items:
+                    children = chain(islice(children, max_items), ((None, f'...{len(value) - max_items} more'),))
+                write(f'[{nl}{sep * (indent + 2)}')
+                stack.append([children, f',{nl}{sep * (indent + 2)}', f'{nl}{sep * (indent + 1)}]', indent + 1,
+                              depth + 1, False])
+            else:
+                write(str(value))
+        
+        begin(self, level - 1, 0)
+        while stack:
+            frame = stack[-1]
+            child = next(frame[0], None)
+            if child is None:
+                stack.pop()
+                write(frame[2])
+                continue
+            if frame[5]:
+                write(frame[1])
+            frame[5] = True
+            if child[0] is not None:
+                write(f'{child[0]} = ')
+            begin(child[1], frame[3], frame[4])
+    
+    def _fields(self) -> Iterable[Tuple[str, Any]]:
+        return filter(lambda x: x[0] != '_SupercellApiResponse__success', vars(self).items())
     
     def __repr__(self):
-        return self.to_string()
+        # bounded, so logging a large object by mistake stays cheap
+        return self.to_string(max_depth = REPR_MAX_DEPTH, max_items = REPR_MAX_ITEMS)
     
     def __bool__(self):
         return self.__success
 
 
+class SlottedApiResponse:
+    """
+    Superclass of the compact variants of the API responses, available as the ``Slotted`` attribute of each type,
+    like :class:`async_supercell_api.clash_royale.types.players.Player.Slotted`.
+    Fields are stored in slots instead of a per-instance dict, and nested objects are compact variants too.
+    Fields unknown to the schema of the type are collected in :attr:`extra`, which is None if there are none.
+    Constructors of the variants are generated from the schema, see :func:`~async_supercell_api.schema.define_schemas`.
+    """
+    
+    __slots__ = ('extra',)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """
+        Builds an object from its decoded JSON.
+        
+        :param data:
+        :type data: Dict[str, Any]
+        """
+        
+        return cls(**data)
+    
+    def _fields(self) -> Iterable[Tuple[str, Any]]:
+        for field in self._schema.fields:
+            # fields can be left unset by a projection
+            value = getattr(self, field.name, None)
+            if value is not None:
+                yield field.name, value
+        if self.extra:
+            yield from self.extra.items()
+    
+    to_dict = SupercellApiResponse.to_dict
+    to_bytes = SupercellApiResponse.to_bytes
+    from_bytes = SupercellApiResponse.__dict__['from_bytes']
+    to_string = SupercellApiResponse.to_string
+    write_string = SupercellApiResponse.write_string
+    __repr__ = SupercellApiResponse.__repr__
+
+
+class FrozenApiResponse:
+    """
+    Mixin of the shared variants of the static types, like arenas, game modes, locations, leagues and labels.
+    Their objects are canonical instances shared by all the responses, see
+    :func:`~async_supercell_api.schema.define_schemas`, so they can't be modified
+    and two of them are equal only if they are the same object.
+    
+    Calling the class with keyword fields, like ``Arena.Shared(id = 54000000, name = 'Legendary')``,
+    returns the canonical instance of these values, as :meth:`from_dict` would.
+    Unpickled objects are the canonical instances of the receiving process too.
+    """
+    
+    __slots__ = ()
+    
+    def __new__(cls, *args, **kwargs):
+        if args:
+            raise TypeError(f'{cls.__qualname__} only takes keyword arguments')
+        return cls.from_dict(kwargs)
+    
+    def __init__(self, *args, **kwargs):
+        # the instance returned by __new__ is already built
+        pass
+    
+    def __reduce__(self):
+        return type(self).from_dict, (self.to_dict(),)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} objects are shared and can\'t be modified')
+    
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} objects are shared and can\'t be modified')
+
+
 T = TypeVar('T')
 
 
+class LazyList(Sequence[T]):
+    """
+    Read-only list of API objects, each one built from its raw dict on first access and cached afterwards.
+    Supports ``len``, indexing, slicing and iteration like a normal list. The raw dicts are never modified.
+    
+    :param raw: raw dicts of the items
+    :param item_type: type of the items
+    :type raw: List[Dict[str, Any]]
+    :type item_type: Type[:class:`SupercellApiResponse`]
+    """
+    
+    __slots__ = ('_raw', '_items', '_item_type')
+    
+    def __init__(self, raw: List[Dict[str, Any]], item_type: Type[T]):
+        self._raw = raw
+        self._items: List[Optional[T]] = [None] * len(raw)
+        self._item_type = item_type
+    
+    def __len__(self) -> int:
+        return len(self._raw)
+    
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:
+        ...
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._item_type.from_dict(self._raw[index])
+        return item
+    
+    def __iter__(self) -> Iterator[T]:
+        for i in range(len(self._raw)):
+            yield self[i]
+    
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self):
+        # bounded like the objects: only the items shown are built
+        shown = [
+            item.to_string(max_depth = REPR_MAX_DEPTH - 1, max_items = REPR_MAX_ITEMS)
+            if isinstance(item, (SupercellApiResponse, SlottedApiResponse)) else repr(item)
+            for item in islice(self, REPR_MAX_ITEMS)
+        ]
+        if len(self._raw) > REPR_MAX_ITEMS:
+            shown.append(f'...{len(self._raw) - REPR_MAX_ITEMS} more')
+        return f'[{", ".join(shown)}]'
+
+
 class Page(SupercellApiResponse, Generic[T]):
     """
     Object representing a list of items. It's returned by all the methods that have the 'limit', 'after' and 'before' parameters.
+    Items are only built when accessed, see :class:`LazyList`, except for the pages built in the executor
+    of the client, which hold a plain list of items that are all built already.
     
     :param items: list of items
     :param paging: info about the current, next and previous pages
@@ -76,5 +330,44 @@ class Page(SupercellApiResponse, Generic[T]):
     def __init__(self, items: Optional[List[T]] = None, paging: Optional[Dict[str, Any]] = None,
                  _page_generic_type: Optional[Type[SupercellApiResponse]] = None, **kwargs):
         super().__init__(**kwargs)
-        self.items: List[T] = None if items is None else list(map(lambda x: _page_generic_type(**x), items))
+        self.items: Optional[Sequence[T]] = items if items is None or _page_generic_type is None else LazyList(
+            items, _page_generic_type
+        )
         self.paging = paging
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the page to the binary format of :meth:`SupercellApiResponse.to_bytes`,
+        together with the type of its items, so it can be loaded back with :meth:`from_bytes`.
+        Items must be objects of a type with a schema, all of the same type.
+        
+        :rtype: bytes
+        """
+        
+        item_type = type(self.items[0]) if self.items else None
+        return marshal.dumps((
+            None if item_type is None else item_type.__module__,
+            None if item_type is None else item_type.__qualname__,
+            None if self.items is None else [item._to_tuple() for item in self.items],
+            self.paging,
+        ))
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Page':
+        """
+        Loads a page serialized with :meth:`to_bytes`, with items of the same type.
+        
+        :param data:
+        :type data: bytes
+        :rtype: :class:`Page`
+        """
+        
+        module, qualname, items, paging = marshal.loads(data)
+        if module is not None:
+            item_type: Any = import_module(module)
+            for name in qualname.split('.'):
+                item_type = getattr(item_type, name)
+            if not (isinstance(item_type, type) and issubclass(item_type, (SupercellApiResponse, SlottedApiResponse))):
+                raise TypeError(f'{module}.{qualname} is not a type of the API')
+            items = list(map(item_type._from_tuple, items))
+        return cls(items = items, paging = paging)
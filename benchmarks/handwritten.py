@@ -0,0 +1,119 @@
+"""
+Reference implementation of the models in the style used before their constructors were compiled from the schemas:
+hand-written constructors unpacking keyword arguments, used as the baseline of ``models.py``.
+"""
+from typing import Any, Dict, List, Optional
+
+from async_supercell_api.types import SupercellApiResponse
+
+
+class Battle(SupercellApiResponse):
+    def __init__(self, gameMode: Optional[dict] = None, arena: Optional[dict] = None, type: Optional[str] = None,
+                 deckSelection: Optional[str] = None, opponent: Optional[List[dict]] = None,
+                 challengeWinCountBefore: Optional[int] = None, boatBattleSide: Optional[str] = None,
+                 boatBattleWon: Optional[bool] = None, newTowersDestroyed: Optional[int] = None,
+                 prevTowersDestroyed: Optional[int] = None, remainingTowers: Optional[int] = None,
+                 team: Optional[List[dict]] = None, battleTime: Optional[str] = None, challengeId: Optional[int] = None,
+                 tournamentTag: Optional[str] = None, challengeTitle: Optional[str] = None,
+                 isLadderTournament: Optional[bool] = None, isHostedMatch: Optional[bool] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.gameMode = None if gameMode is None else GameMode(**gameMode)
+        self.arena = None if arena is None else Arena(**arena)
+        self.type = type
+        self.deckSelection = deckSelection
+        self.opponent = None if opponent is None else list(map(lambda x: PlayerBattleData(**x), opponent))
+        self.challengeWinCountBefore = challengeWinCountBefore
+        self.boatBattleSide = boatBattleSide
+        self.boatBattleWon = boatBattleWon
+        self.newTowersDestroyed = newTowersDestroyed
+        self.prevTowersDestroyed = prevTowersDestroyed
+        self.remainingTowers = remainingTowers
+        self.team = None if team is None else list(map(lambda x: PlayerBattleData(**x), team))
+        self.battleTime = battleTime
+        self.challengeId = challengeId
+        self.tournamentTag = tournamentTag
+        self.challengeTitle = challengeTitle
+        self.isLadderTournament = isLadderTournament
+        self.isHostedMatch = isHostedMatch
+
+
+class PlayerBattleData(SupercellApiResponse):
+    def __init__(self, clan: Optional[dict] = None, cards: Optional[List[dict]] = None, tag: Optional[str] = None,
+                 name: Optional[str] = None, startingTrophies: Optional[int] = None, trophyChange: Optional[int] = None,
+                 crowns: Optional[int] = None, kingTowerHitPoints: Optional[int] = None,
+                 princessTowersHitPoints: Optional[List[int]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.clan = None if clan is None else PlayerClan(**clan)
+        self.cards = None if cards is None else list(map(lambda x: PlayerItemLevel(**x), cards))
+        self.tag = tag
+        self.name = name
+        self.startingTrophies = startingTrophies
+        self.trophyChange = trophyChange
+        self.crowns = crowns
+        self.kingTowerHitPoints = kingTowerHitPoints
+        self.princessTowersHitPoints = princessTowersHitPoints
+
+
+class GameMode(SupercellApiResponse):
+    def __init__(self, id: Optional[int] = None, name: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.id = id
+        self.name = name
+
+
+class PlayerClan(SupercellApiResponse):
+    def __init__(self, badgeId: Optional[int] = None, tag: Optional[str] = None, name: Optional[str] = None,
+                 badgeUrls: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.badgeId = badgeId
+        self.tag = tag
+        self.name = name
+        self.badgeUrls = badgeUrls
+
+
+class PlayerItemLevel(SupercellApiResponse):
+    def __init__(self, id: Optional[int] = None, count: Optional[int] = None, level: Optional[int] = None,
+                 starLevel: Optional[int] = None, name: Optional[str] = None, maxLevel: Optional[int] = None,
+                 iconUrls: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.id = id
+        self.count = count
+        self.level = level
+        self.starLevel = starLevel
+        self.name = name
+        self.maxLevel = maxLevel
+        self.iconUrls = iconUrls
+
+
+class Arena(SupercellApiResponse):
+    def __init__(self, name: Optional[str] = None, id: Optional[int] = None, iconUrls: Optional[Dict[str, Any]] = None,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self.id = id
+        self.iconUrls = iconUrls
+
+
+class PlayerRanking(SupercellApiResponse):
+    def __init__(self, clan: Optional[dict] = None, arena: Optional[dict] = None, tag: Optional[str] = None,
+                 name: Optional[str] = None, expLevel: Optional[int] = None, rank: Optional[int] = None,
+                 previousRank: Optional[int] = None, trophies: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.clan = None if clan is None else PlayerRankingClan(**clan)
+        self.arena = None if arena is None else Arena(**arena)
+        self.tag = tag
+        self.name = name
+        self.expLevel = expLevel
+        self.rank = rank
+        self.previousRank = previousRank
+        self.trophies = trophies
+
+
+class PlayerRankingClan(SupercellApiResponse):
+    def __init__(self, badgeId: Optional[int] = None, tag: Optional[str] = None, name: Optional[str] = None,
+                 badgeUrls: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.badgeId = badgeId
+        self.tag = tag
+        self.name = name
+        self.badgeUrls = badgeUrls
@@ -0,0 +1,91 @@
+"""
+Microbenchmarks of the model constructors and of their serialization.
+
+Run from the root of the repository with ``python benchmarks/models.py``.
+"""
+import json
+import marshal
+import os
+import pickle
+import sys
+from timeit import repeat
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from async_supercell_api.clash_royale.types.locations import PlayerRanking
+from async_supercell_api.decoding import DECODERS
+from async_supercell_api.clash_royale.types.players import Battle
+import handwritten
+
+CARD = {'name': 'Knight', 'id': 26000000, 'level': 14, 'starLevel': 1, 'maxLevel': 14, 'iconUrls': {'medium': 'url'}}
+PLAYER = {
+    'tag': '#2PP', 'name': 'player', 'startingTrophies': 7000, 'trophyChange': 30, 'crowns': 3,
+    'kingTowerHitPoints': 4000, 'princessTowersHitPoints': [3000, 3000], 'clan': {'tag': '#CLAN', 'name': 'clan'},
+    'cards': [CARD] * 8,
+}
+BATTLE = {
+    'type': 'PvP', 'battleTime': '20220101T000000.000Z', 'isLadderTournament': False, 'deckSelection': 'collection',
+    'arena': {'id': 54000000, 'name': 'Legendary Arena'}, 'gameMode': {'id': 72000006, 'name': 'Ladder'},
+    'team': [PLAYER], 'opponent': [PLAYER],
+}
+BATTLE_LOG = [BATTLE] * 25
+RANKING = [
+    {
+        'tag': f'#{i}', 'name': f'player {i}', 'expLevel': 14, 'trophies': 7000 - i, 'rank': i, 'previousRank': i,
+        'clan': {'tag': '#CLAN', 'name': 'clan', 'badgeId': 16000000},
+        'arena': {'id': 54000000, 'name': 'Legendary Arena'},
+    } for i in range(1000)
+]
+
+
+def bench(name: str, func, number: int, base: float = None) -> float:
+    best = min(repeat(func, number = number, repeat = 5)) / number
+    print(f'{name:<45} {best * 1000:8.3f} ms' + ('' if base is None else f'  x{base / best:.2f}'))
+    return best
+
+
+def main():
+    for title, cls, data, number in (
+            ('battle log (25 battles)', Battle, BATTLE_LOG, 200),
+            ('ranking page (1000 players)', PlayerRanking, RANKING, 20),
+    ):
+        print(title)
+        reference = getattr(handwritten, cls.__name__)
+        base = bench('  Cls(**x) (hand-written __init__)', lambda: [reference(**x) for x in data], number)
+        for name, func in (
+                ('  Cls(**x) (compiled)', lambda: [cls(**x) for x in data]),
+                ('  Cls.from_dict(x) (compiled)', lambda: list(map(cls.from_dict, data))),
+                ('  Cls.Slotted(**x) (compiled)', lambda: [cls.Slotted(**x) for x in data]),
+                ('  Cls.Slotted.from_dict(x) (compiled)', lambda: list(map(cls.Slotted.from_dict, data))),
+        ):
+            bench(name, func, number, base)
+    serialization()
+
+
+def serialization():
+    for title, cls, data, number in (
+            ('battle log (25 battles), loading', Battle, BATTLE_LOG, 200),
+            ('ranking page (1000 players), loading', PlayerRanking, RANKING, 20),
+    ):
+        print(title)
+        objects = [cls.from_dict(x) for x in data]
+        body = json.dumps(data).encode()
+        # the whole list in a single buffer, with the same format to_bytes uses for each object
+        binary = marshal.dumps([obj._to_tuple() for obj in objects])
+        pickled = pickle.dumps(objects, pickle.HIGHEST_PROTOCOL)
+        base = None
+        for name, loads in DECODERS.items():
+            best = bench(f'  {name} + Cls.from_dict(x) ({len(body)} B)',
+                         lambda: list(map(cls.from_dict, loads(body))), number, base)
+            base = best if base is None else base
+        bench(f'  pickle ({len(pickled)} B)', lambda: pickle.loads(pickled), number, base)
+        bench(f'  Cls.from_bytes(x) ({len(binary)} B)',
+              lambda: list(map(cls._from_tuple, marshal.loads(binary))), number, base)
+        print(title.replace('loading', 'saving'))
+        base = bench('  json.dumps(Cls.to_dict(x))', lambda: json.dumps([obj.to_dict() for obj in objects]), number)
+        bench('  pickle', lambda: pickle.dumps(objects, pickle.HIGHEST_PROTOCOL), number, base)
+        bench('  Cls.to_bytes(x)', lambda: marshal.dumps([obj._to_tuple() for obj in objects]), number, base)
+
+
+if __name__ == '__main__':
+    main()
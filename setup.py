@@ -16,5 +16,9 @@ setuptools.setup(
     python_requires = '>=3.7',
     install_requires = [
         'aiohttp',
-    ]
+    ],
+    extras_require = {
+        'orjson': ['orjson'],
+        'ujson': ['ujson'],
+    }
 )
\ No newline at end of file